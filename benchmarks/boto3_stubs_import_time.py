@@ -0,0 +1,97 @@
+"""
+compare runtime import time of boto3-stubs with lazy and eager service type imports.
+
+usage:
+    python benchmarks/boto3_stubs_import_time.py [--runs 20]
+
+eager mode reproduces the previous module layout, which tried to import every
+service type at import time. shard mode resolves one service type, which loads
+a single `_services` shard. each run is a fresh interpreter, cold runs drop
+bytecode caches first, warm runs reuse them.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+STUBS_DIR = (
+    Path(__file__).absolute().parent.parent
+    / "mypy_boto3_output"
+    / "boto3_stubs_package"
+    / "boto3-stubs"
+)
+STUBS_PATH = STUBS_DIR / "__init__.py"
+
+RUN_TEMPLATE = """
+import importlib, importlib.util, time
+import boto3.session
+started_at = time.perf_counter()
+spec = importlib.util.spec_from_file_location("boto3_stubs_runtime", {path!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+if {mode!r} == "eager":
+    for name, (module_name, shard_name) in module._LAZY_TYPES.items():
+        try:
+            importlib.import_module(module_name)
+        except ModuleNotFoundError:
+            pass
+elif {mode!r} == "shard":
+    module.STSClient
+print(time.perf_counter() - started_at)
+"""
+
+
+def drop_bytecode() -> None:
+    for cache_dir in STUBS_DIR.rglob("__pycache__"):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def time_import(mode: str, cold: bool, runs: int) -> List[float]:
+    code = RUN_TEMPLATE.format(path=str(STUBS_PATH), mode=mode)
+    env = dict(os.environ)
+    if cold:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    else:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        # populate bytecode caches before measuring warm imports
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, env=env
+        )
+    timings = []
+    for _ in range(runs):
+        if cold:
+            drop_bytecode()
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        timings.append(float(output))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    results: Dict[str, List[float]] = {}
+    for cache in ("cold", "warm"):
+        for mode in ("eager", "lazy", "shard"):
+            results[f"{cache} {mode}"] = time_import(mode, cache == "cold", args.runs)
+    for name, timings in results.items():
+        print(
+            f"{name:<11} median {statistics.median(timings) * 1000:.1f}ms "
+            f"min {min(timings) * 1000:.1f}ms ({len(timings)} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
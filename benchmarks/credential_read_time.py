@@ -0,0 +1,153 @@
+"""
+compare latency of reading cached mfa session from file, local http, broker and shared memory.
+
+usage:
+    python benchmarks/credential_read_time.py [--reads 10000]
+
+file reads `SessionCache`, http fetches `credential_process` json from a local
+server with a new connection per read, broker asks a `main.py broker` process
+over a persistent unix socket connection, shared memory reads `SharedCredentials`.
+attach rows include mapping the segment, the cost a short lived process pays once.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List
+
+SRC_PATH = Path(__file__).absolute().parent.parent / "src"
+sys.path.insert(0, str(SRC_PATH))
+
+from broker import BrokerClient  # noqa: E402
+from credentials import SessionCredentials  # noqa: E402
+from log import setup_logging  # noqa: E402
+from session_cache import SessionCache  # noqa: E402
+from shared_credentials import SharedCredentials  # noqa: E402
+
+CONFIG_NAME = f"benchmark-{os.getpid()}"
+
+CREDENTIALS = SessionCredentials(
+    "ASIAEXAMPLEEXAMPLE00",
+    "s" * 40,
+    "FwoGZXIvYXdzE" + "t" * 700,
+    datetime.now(timezone.utc) + timedelta(hours=12),
+)
+
+
+def time_reads(read: Callable[[], object], reads: int) -> List[float]:
+    timings = []
+    for _ in range(reads):
+        started_at = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def serve_http() -> ThreadingHTTPServer:
+    body = CREDENTIALS.to_json().encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reads", type=int, default=10000)
+    args = parser.parse_args()
+    setup_logging("WARNING")
+
+    # broker process reads session cache of this home
+    home = Path(tempfile.mkdtemp(prefix="mfa-auth-home-"))
+    session_cache = SessionCache(
+        CONFIG_NAME, cache_dir=home / ".aws" / "mfa-auth" / "cache"
+    )
+    session_cache.save(CREDENTIALS)
+    socket_path = home / "broker.sock"
+    broker = subprocess.Popen(
+        [
+            sys.executable,
+            str(SRC_PATH / "main.py"),
+            "--log-level",
+            "WARNING",
+            "broker",
+            "--socket",
+            str(socket_path),
+        ],
+        cwd=home,
+        env={**os.environ, "HOME": str(home)},
+    )
+    while not socket_path.exists():
+        time.sleep(0.05)
+    broker_client = BrokerClient(socket_path)
+
+    server = serve_http()
+    url = f"http://127.0.0.1:{server.server_port}/"
+
+    def read_http() -> SessionCredentials:
+        with urllib.request.urlopen(url) as response:
+            return SessionCredentials.from_json(response.read())
+
+    publisher = SharedCredentials.create(CONFIG_NAME)
+    publisher.publish(CREDENTIALS)
+    reader = SharedCredentials.attach(CONFIG_NAME)
+
+    def attach_and_read() -> None:
+        shared = SharedCredentials.attach(CONFIG_NAME)
+        shared.read()
+        shared.close()
+
+    try:
+        results = {
+            "file": time_reads(session_cache.load, args.reads),
+            "http": time_reads(read_http, min(args.reads, 2000)),
+            "broker": time_reads(
+                lambda: broker_client.get_credentials(CONFIG_NAME), args.reads
+            ),
+            "shm attach": time_reads(attach_and_read, args.reads),
+            "shm read": time_reads(reader.read, args.reads),
+        }
+        broker_stats = broker_client.stats()
+    finally:
+        broker_client.close()
+        broker.terminate()
+        broker.wait()
+        reader.close()
+        publisher.close()
+        publisher.unlink()
+        server.shutdown()
+
+    for name, timings in results.items():
+        print(
+            f"{name:<11} median {statistics.median(timings) * 1e6:8.1f}us "
+            f"p99 {sorted(timings)[int(len(timings) * 0.99)] * 1e6:8.1f}us "
+            f"({len(timings)} reads)"
+        )
+    print(
+        f"broker handling median {broker_stats['p50'] * 1e6:.1f}us "
+        f"p99 {broker_stats['p99'] * 1e6:.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
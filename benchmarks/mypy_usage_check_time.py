@@ -0,0 +1,67 @@
+"""
+compare mypy check time of a project with full and usage-driven mypy_boto3 overloads.
+
+usage:
+    python benchmarks/mypy_usage_check_time.py <project-path> [--runs 3]
+
+mypy_boto3 and mypy must be installed in current environment.
+every run starts with an empty mypy cache so results are comparable.
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+
+def regenerate(usage_path: str = "") -> None:
+    command = [sys.executable, "-m", "mypy_boto3", "-q"]
+    if usage_path:
+        command.extend(["--usage", usage_path])
+    subprocess.run(command, check=True)
+
+
+def time_mypy(project_path: str, runs: int) -> List[float]:
+    timings = []
+    for _ in range(runs):
+        cache_dir = tempfile.mkdtemp(prefix="mypy-cache-")
+        started_at = time.perf_counter()
+        # mypy exit code reflects type errors of the project, not a failed run
+        subprocess.run(
+            [sys.executable, "-m", "mypy", "--cache-dir", cache_dir, project_path],
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - started_at)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("project_path")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    for mode, usage_path in (("full", ""), ("usage", args.project_path)):
+        regenerate(usage_path)
+        results[mode] = time_mypy(args.project_path, args.runs)
+
+    # leave full overloads in place after benchmark
+    regenerate()
+
+    for mode, timings in results.items():
+        print(
+            f"{mode:<6} median {statistics.median(timings):.2f}s "
+            f"min {min(timings):.2f}s max {max(timings):.2f}s ({len(timings)} runs)"
+        )
+    ratio = statistics.median(results["full"]) / statistics.median(results["usage"])
+    print(f"full / usage median check time: {ratio:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Runtime shard of boto3-stubs for waf-regional service, loaded on demand.
+"""
+import sys
+from typing import Any, Optional, Union, overload
+
+from botocore.config import Config
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+try:
+    from mypy_boto3_waf_regional.client import WAFRegionalClient
+except ModuleNotFoundError:
+    WAFRegionalClient = Any
+
+
+@overload
+def client(
+    service_name: Literal["waf-regional"],
+    region_name: Optional[str] = ...,
+    api_version: Optional[str] = ...,
+    use_ssl: Optional[bool] = ...,
+    verify: Union[bool, str, None] = ...,
+    endpoint_url: Optional[str] = ...,
+    aws_access_key_id: Optional[str] = ...,
+    aws_secret_access_key: Optional[str] = ...,
+    aws_session_token: Optional[str] = ...,
+    config: Optional[Config] = ...,
+) -> WAFRegionalClient:
+    ...
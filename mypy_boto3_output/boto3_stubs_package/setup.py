@@ -34,7 +34,7 @@ setup(
     keywords="boto3 type-annotations boto3-stubs mypy typeshed autocomplete",
     long_description=LONG_DESCRIPTION,
     long_description_content_type="text/markdown",
-    package_data={"boto3-stubs": ["py.typed", "*.pyi", "*/*.pyi"]},
+    package_data={"boto3-stubs": ["py.typed", "*.pyi", "*/*.pyi", "_services/*.py"]},
     python_requires=">=3.6",
     project_urls={
         "Documentation": "https://mypy-boto3-builder.readthedocs.io/en/latest/",
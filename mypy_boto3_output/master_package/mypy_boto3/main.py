@@ -1,16 +1,28 @@
 import argparse
+import ast
+import hashlib
 import importlib
+import importlib.util
+import json
 import logging
 import pathlib
 import shutil
-from typing import List, Set
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional, Set, Tuple
 
+from mypy_boto3.manifest import FileManifest, Manifest
 from mypy_boto3.submodules import SUBMODULES, Submodule
+from mypy_boto3.usage import scan_service_usage
 from mypy_boto3.version import __version__ as version
 
 ROOT_PATH = pathlib.Path(__file__).absolute().parent
 CACHE_PATH = ROOT_PATH / "cache.txt"
+MANIFEST_PATH = ROOT_PATH / "manifest.json"
 BOTO3_STUBS_NAME = "boto3-stubs"
+SERVICES_INDEX_NAME = "services_index.json"
+SERVICES_INDEX_VERSION = 1
 MODULE_NAME = "mypy_boto3"
 
 FUNCTION_TEMPLATE = """{overload}def {name}(
@@ -56,6 +68,41 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("-d", "--debug", action="store_true", help="Hide log output")
     parser.add_argument("-q", "--quiet", action="store_true", help="Verbose log output")
     parser.add_argument("-c", "--clean", action="store_true", help="Remove all generated files")
+    parser.add_argument(
+        "-a",
+        "--add",
+        nargs="+",
+        default=[],
+        metavar="SERVICE",
+        help="Add installed service stubs to index, for example: -a sts s3",
+    )
+    parser.add_argument(
+        "-r",
+        "--remove",
+        nargs="+",
+        default=[],
+        metavar="SERVICE",
+        help="Remove service stubs from index",
+    )
+    parser.add_argument(
+        "-u",
+        "--usage",
+        nargs="+",
+        default=[],
+        type=pathlib.Path,
+        metavar="PATH",
+        help=(
+            "Generate client/resource overloads only for services"
+            " referenced in these project sources"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes to build service stubs, defaults to CPU count",
+    )
     return parser
 
 
@@ -88,6 +135,7 @@ def main() -> None:
     if args.clean:
         file_paths = [
             ROOT_PATH / "cache.txt",
+            MANIFEST_PATH,
             ROOT_PATH / "boto3_init_gen.py",
             ROOT_PATH / "boto3_session_gen.py",
         ]
@@ -104,6 +152,10 @@ def main() -> None:
             if submodule_path.exists():
                 logger.info("Removing folder %s", submodule_path)
                 shutil.rmtree(submodule_path)
+        index_path = get_services_index_path()
+        if index_path is not None and index_path.exists():
+            logger.info("Removing file %s", index_path)
+            index_path.unlink()
 
         package_names = [
             "boto3-stubs",
@@ -123,55 +175,283 @@ def main() -> None:
             " ".join(package_names),
         )
         return
-    build_package_methods(logger)
+    if args.add or args.remove:
+        update_index(args.add, args.remove, logger, args.jobs)
+        return
+
+    manifest = load_manifest()
+    manifest.used = None
+    if args.usage:
+        manifest.used = sorted(scan_service_usage(args.usage, args.jobs))
+        logger.info("Services used in project: %s", ", ".join(manifest.used))
+    build_package_methods(logger, manifest.files, manifest.used)
+    installed_submodules: List[Submodule] = []
     for submodule in SUBMODULES:
         if not submodule.is_installed:
-            submodule_path = ROOT_PATH / submodule.import_name
-            if submodule_path.exists():
-                logger.debug("Removing directory for deleted service %s", submodule_path)
-                shutil.rmtree(submodule_path)
+            remove_package_stubs(submodule, logger, manifest)
             continue
-        build_package_stubs(submodule, logger)
-    set_cache_key()
+        installed_submodules.append(submodule)
+    build_packages_stubs(installed_submodules, logger, args.jobs, manifest.files)
+    manifest.active = [i.boto3_name for i in SUBMODULES if i.is_active]
+    manifest.installed = {i.boto3_name: get_stubs_version(i) for i in installed_submodules}
+    save_manifest(manifest)
+    write_services_index(logger)
     log_install_info(logger)
 
 
-def set_cache_key() -> None:
-    cache_key = ",".join([i.boto3_name for i in SUBMODULES if i.is_active])
-    CACHE_PATH.write_text(cache_key)
+def load_manifest() -> Manifest:
+    return Manifest.load(MANIFEST_PATH, CACHE_PATH)
 
 
-def add_package_to_index(boto3_name: str) -> None:
-    """
-    Add new package to index and rebuild it if package is new.
-    """
-    active_boto3_names: Set[str] = {boto3_name}
-    active_submodule = SUBMODULES[0]
-    logger = get_logger(logging.INFO)
+def save_manifest(manifest: Manifest) -> None:
+    manifest.save(MANIFEST_PATH)
+    # manifest replaces legacy cache key file
     if CACHE_PATH.exists():
-        active_boto3_names.update(CACHE_PATH.read_text().split(","))
+        CACHE_PATH.unlink()
 
-    for submodule in SUBMODULES:
-        if submodule.boto3_name in active_boto3_names:
-            submodule.is_active = True
-        if submodule.boto3_name == boto3_name:
-            submodule.is_active = True
-            submodule.is_installed = True
-            active_submodule = submodule
+
+def remove_package_stubs(submodule: Submodule, logger: logging.Logger, manifest: Manifest) -> None:
+    submodule_path = ROOT_PATH / submodule.import_name
+    if submodule_path.exists():
+        logger.debug("Removing directory for deleted service %s", submodule_path)
+        shutil.rmtree(submodule_path)
+    manifest.forget_directory(submodule.import_name)
+    manifest.installed.pop(submodule.boto3_name, None)
+
+
+def update_index(
+    add_boto3_names: Iterable[str],
+    remove_boto3_names: Iterable[str] = (),
+    logger: Optional[logging.Logger] = None,
+    jobs: Optional[int] = None,
+) -> None:
+    """
+    Add and remove packages in one incremental rebuild.
+
+    `boto3.client`/`boto3.resource` annotations are regenerated once if active
+    services changed, and only added or upgraded service stubs are rebuilt.
+    """
+    logger = logger or get_logger(logging.INFO)
+    added = _get_submodules(add_boto3_names, logger)
+    added_names = {i.boto3_name for i in added}
+    removed = [
+        i for i in _get_submodules(remove_boto3_names, logger) if i.boto3_name not in added_names
+    ]
+    manifest = load_manifest()
+    previous_active = set(manifest.active)
+
+    for submodule in _get_submodules(previous_active, logger):
+        submodule.is_active = True
+    for submodule in added:
+        submodule.is_installed = True
+        submodule.is_active = True
+    for submodule in removed:
+        submodule.is_installed = False
+        submodule.is_active = False
 
     logger.info("Active packages: %s", ", ".join([i.boto3_name for i in SUBMODULES if i.is_active]))
     logger.info(
         "Installed packages: %s", ", ".join([i.boto3_name for i in SUBMODULES if i.is_installed])
     )
-    build_package_methods(logger)
-    build_package_stubs(active_submodule, logger)
-    set_cache_key()
+
+    active = [i.boto3_name for i in SUBMODULES if i.is_active]
+    if set(active) != previous_active:
+        build_package_methods(logger, manifest.files, manifest.used)
+    manifest.active = active
+
+    for submodule in removed:
+        remove_package_stubs(submodule, logger, manifest)
+
+    changed_submodules: List[Submodule] = []
+    for submodule in added:
+        version = get_stubs_version(submodule)
+        if (
+            manifest.installed.get(submodule.boto3_name, "") == version
+            and (ROOT_PATH / submodule.import_name).exists()
+        ):
+            logger.debug("Service stubs %s are up to date", submodule.boto3_name)
+            continue
+        manifest.installed[submodule.boto3_name] = version
+        changed_submodules.append(submodule)
+
+    build_packages_stubs(changed_submodules, logger, jobs, manifest.files)
+    save_manifest(manifest)
+    write_services_index(logger)
     log_install_info(logger)
 
 
-def _get_proxy_contents(module_name: str) -> str:
+def _get_submodules(boto3_names: Iterable[str], logger: logging.Logger) -> List[Submodule]:
+    """
+    Look up submodules by boto3 names, sorted by module name.
+    """
+    submodules: List[Submodule] = []
+    for boto3_name in set(boto3_names):
+        submodule = SUBMODULES.get_by_boto3_name(boto3_name)
+        if submodule is None:
+            logger.warning("Unknown service %s, skipping", boto3_name)
+            continue
+        submodules.append(submodule)
+    submodules.sort(key=lambda i: i.module_name)
+    return submodules
+
+
+def get_services_index_path() -> Optional[pathlib.Path]:
+    spec = importlib.util.find_spec(BOTO3_STUBS_NAME)
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return pathlib.Path(list(spec.submodule_search_locations)[0]) / SERVICES_INDEX_NAME
+
+
+def write_services_index(logger: logging.Logger) -> None:
+    """
+    Write installed service stubs index next to `boto3-stubs` runtime module.
+
+    `boto3-stubs` uses it to skip import attempts for services that are not installed.
+    """
+    index_path = get_services_index_path()
+    if index_path is None:
+        logger.debug("%s is not installed, skipping services index", BOTO3_STUBS_NAME)
+        return
+
+    stubs_path = index_path.parent
+    stubs_version = None
+    version_path = stubs_path / "version.py"
+    if version_path.exists():
+        stubs_version = _get_static_value(version_path, "__version__")
+
+    services = {}
+    for submodule in SUBMODULES:
+        if not submodule.is_installed:
+            continue
+        service_spec = importlib.util.find_spec(submodule.module_name)
+        if service_spec is None or not service_spec.submodule_search_locations:
+            continue
+        services[submodule.module_name] = list(service_spec.submodule_search_locations)[0]
+
+    index = {
+        "version": SERVICES_INDEX_VERSION,
+        "stubs_version": stubs_version,
+        "prefix": sys.prefix,
+        "python": "{}.{}".format(*sys.version_info[:2]),
+        "services": services,
+    }
+    try:
+        write_text(index_path, json.dumps(index, indent=2, sort_keys=True), logger)
+    except OSError as err:
+        logger.warning("Cannot write services index %s: %s", index_path, err)
+
+
+def add_packages_to_index(boto3_names: Iterable[str]) -> None:
+    """
+    Add new packages to index with a single rebuild.
+    """
+    update_index(boto3_names)
+
+
+def remove_packages_from_index(boto3_names: Iterable[str]) -> None:
+    """
+    Remove packages from index with a single rebuild.
+    """
+    update_index((), boto3_names)
+
+
+def add_package_to_index(boto3_name: str) -> None:
+    """
+    Add new package to index and rebuild it if package is new.
+    """
+    update_index([boto3_name])
+
+
+def _find_module_source(module_name: str) -> Optional[pathlib.Path]:
+    """
+    Find `.pyi` or `.py` source of a module without importing it or its parents.
+    """
+    top_name, _, sub_name = module_name.partition(".")
+    spec = importlib.util.find_spec(top_name)
+    if spec is None or not spec.submodule_search_locations:
+        return None
+
+    for location in spec.submodule_search_locations:
+        base_path = pathlib.Path(location)
+        if sub_name:
+            base_path = base_path.joinpath(*sub_name.split("."))
+            candidates = [
+                base_path.with_suffix(".pyi"),
+                base_path.with_suffix(".py"),
+            ]
+        else:
+            candidates = []
+        candidates.extend([base_path / "__init__.pyi", base_path / "__init__.py"])
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def _get_static_value(source_path: pathlib.Path, name: str) -> Any:
+    """
+    Parse literal module-level `name` assignment from source without executing it.
+
+    Returns None if assignment is not found or is not a literal.
+    """
+    try:
+        tree = ast.parse(source_path.read_text(), str(source_path))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if not any(isinstance(i, ast.Name) and i.id == name for i in targets):
+            continue
+        try:
+            return ast.literal_eval(node.value)
+        except ValueError:
+            return None
+    return None
+
+
+def _get_static_all(source_path: pathlib.Path) -> Optional[List[str]]:
+    """
+    Parse literal `__all__` from module source without executing it.
+    """
+    module_all = _get_static_value(source_path, "__all__")
+    if isinstance(module_all, (list, tuple)) and all(isinstance(i, str) for i in module_all):
+        return list(module_all)
+    return None
+
+
+def get_stubs_version(submodule: Submodule) -> Optional[str]:
+    """
+    Get installed service stubs version from its `version.py` without importing it.
+    """
+    source_path = _find_module_source("{}.version".format(submodule.module_name))
+    if source_path is None:
+        return None
+    version = _get_static_value(source_path, "__version__")
+    return version if isinstance(version, str) else None
+
+
+def get_module_all(module_name: str) -> List[str]:
+    """
+    Get `__all__` of a module, falling back to import if it is not a literal.
+    """
+    source_path = _find_module_source(module_name)
+    if source_path is not None:
+        module_all = _get_static_all(source_path)
+        if module_all is not None:
+            return module_all
+
     service_module = importlib.import_module(module_name)
-    module_all: List[str] = getattr(service_module, "__all__", [])
+    return list(getattr(service_module, "__all__", []))
+
+
+def _get_proxy_contents(module_name: str) -> str:
+    module_all = get_module_all(module_name)
     all_names = "\n    ".join(['"{}",'.format(i) for i in module_all])
     import_names = "\n    ".join(["{},".format(i) for i in module_all])
     return "from {} import (\n    {}\n)\n\n__all__ = (\n    {}\n)\n".format(
@@ -179,7 +459,17 @@ def _get_proxy_contents(module_name: str) -> str:
     )
 
 
-def build_package_methods(logger: logging.Logger) -> None:
+def build_package_methods(
+    logger: logging.Logger,
+    manifest: Optional[FileManifest] = None,
+    used_boto3_names: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Generate `boto3.client`/`boto3.resource` overloads for active services.
+
+    If `used_boto3_names` is set, overloads are generated only for these services.
+    """
+    used: Optional[Set[str]] = None if used_boto3_names is None else set(used_boto3_names)
     init_client_functions: List[str] = []
     init_resource_functions: List[str] = []
     session_client_functions: List[str] = []
@@ -189,6 +479,9 @@ def build_package_methods(logger: logging.Logger) -> None:
     for submodule in SUBMODULES:
         if not submodule.is_active:
             continue
+        if used is not None and submodule.boto3_name not in used:
+            logger.debug("Skipping unused %s service stubs", submodule.class_name)
+            continue
 
         active_submodules.append(submodule)
         logger.info(
@@ -310,20 +603,55 @@ def build_package_methods(logger: logging.Logger) -> None:
     session_contents.extend(session_client_functions)
     session_contents.extend(session_resource_functions)
 
-    write_text(ROOT_PATH / "boto3_init_gen.py", "\n".join(init_contents), logger)
+    write_text(ROOT_PATH / "boto3_init_gen.py", "\n".join(init_contents), logger, manifest)
     logger.info("Generated annotations for boto3.client and boto3.resource functions")
-    write_text(ROOT_PATH / "boto3_session_gen.py", "\n".join(session_contents), logger)
+    write_text(ROOT_PATH / "boto3_session_gen.py", "\n".join(session_contents), logger, manifest)
     logger.info(
         "Generated annotations for boto3.Session.client and boto3.Session.resource functions"
     )
 
 
-def write_text(path: pathlib.Path, text: str, logger: logging.Logger) -> None:
+def write_text(
+    path: pathlib.Path,
+    text: str,
+    logger: logging.Logger,
+    manifest: Optional[FileManifest] = None,
+) -> bool:
+    """
+    Write file only if its content changed, to keep mtimes and mypy cache warm.
+
+    Returns True if file was written.
+    """
+    data = text.encode()
+    digest = hashlib.sha256(data).hexdigest()
+    key = path.relative_to(ROOT_PATH).as_posix() if manifest is not None else ""
+    entry = manifest.get(key) if manifest is not None else None
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        stat = None
+
+    if stat is not None:
+        # manifest is trusted only while file was not touched since it was written
+        if entry and entry["sha256"] == digest and entry["mtime_ns"] == stat.st_mtime_ns:
+            logger.debug("Skipping unchanged %s", path)
+            return False
+        if stat.st_size == len(data) and path.read_bytes() == data:
+            logger.debug("Skipping unchanged %s", path)
+            if manifest is not None:
+                manifest[key] = {"sha256": digest, "mtime_ns": stat.st_mtime_ns}
+            return False
+
     logger.debug("Updating %s", path)
-    path.write_text(text)
+    path.write_bytes(data)
+    if manifest is not None:
+        manifest[key] = {"sha256": digest, "mtime_ns": path.stat().st_mtime_ns}
+    return True
 
 
-def build_package_stubs(submodule: Submodule, logger: logging.Logger) -> None:
+def build_package_stubs(
+    submodule: Submodule, logger: logging.Logger, manifest: Optional[FileManifest] = None
+) -> None:
     """
     Build index for installed services.
     """
@@ -337,17 +665,20 @@ def build_package_stubs(submodule: Submodule, logger: logging.Logger) -> None:
         submodule_path / "__init__.py",
         _get_proxy_contents(submodule.module_name),
         logger,
+        manifest,
     )
     write_text(
         submodule_path / "client.py",
         _get_proxy_contents("{}.client".format(submodule.module_name)),
         logger,
+        manifest,
     )
     logger.info("Generated mypy_boto3.%s.client module" % submodule.import_name)
     write_text(
         submodule_path / "type_defs.py",
         _get_proxy_contents("{}.type_defs".format(submodule.module_name)),
         logger,
+        manifest,
     )
     logger.info("Generated mypy_boto3.%s.type_defs module" % submodule.import_name)
     if submodule.has_resource:
@@ -355,6 +686,7 @@ def build_package_stubs(submodule: Submodule, logger: logging.Logger) -> None:
             submodule_path / "service_resource.py",
             _get_proxy_contents("{}.service_resource".format(submodule.module_name)),
             logger,
+            manifest,
         )
         logger.info("Generated mypy_boto3.%s.service_resource module" % submodule.import_name)
     if submodule.has_waiter:
@@ -362,6 +694,7 @@ def build_package_stubs(submodule: Submodule, logger: logging.Logger) -> None:
             submodule_path / "waiter.py",
             _get_proxy_contents("{}.waiter".format(submodule.module_name)),
             logger,
+            manifest,
         )
         logger.info("Generated mypy_boto3.%s.waiter module" % submodule.import_name)
     if submodule.has_paginator:
@@ -369,10 +702,83 @@ def build_package_stubs(submodule: Submodule, logger: logging.Logger) -> None:
             submodule_path / "paginator.py",
             _get_proxy_contents("{}.paginator".format(submodule.module_name)),
             logger,
+            manifest,
         )
         logger.info("Generated mypy_boto3.%s.paginator module" % submodule.import_name)
 
 
+class _RecordCollector(logging.Handler):
+    """
+    Keep log records of a worker process to re-emit them in order.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record.msg = record.getMessage()
+        record.args = None
+        self.records.append(record)
+
+
+def _build_package_stubs_worker(
+    submodule: Submodule, log_level: int, manifest: FileManifest
+) -> Tuple[List[logging.LogRecord], float, FileManifest]:
+    logger = logging.getLogger("mypy_boto3.worker")
+    logger.propagate = False
+    logger.setLevel(log_level)
+    collector = _RecordCollector()
+    logger.handlers = [collector]
+    started_at = time.perf_counter()
+    build_package_stubs(submodule, logger, manifest)
+    return collector.records, time.perf_counter() - started_at, manifest
+
+
+def _get_directory_manifest(manifest: FileManifest, import_name: str) -> FileManifest:
+    prefix = "{}/".format(import_name)
+    return {key: value for key, value in manifest.items() if key.startswith(prefix)}
+
+
+def build_packages_stubs(
+    submodules: List[Submodule],
+    logger: logging.Logger,
+    jobs: Optional[int] = None,
+    manifest: Optional[FileManifest] = None,
+) -> None:
+    """
+    Build index for installed services on a process pool.
+
+    Logs are emitted in `submodules` order regardless of completion order.
+    """
+    if jobs == 1 or len(submodules) < 2:
+        for submodule in submodules:
+            started_at = time.perf_counter()
+            build_package_stubs(submodule, logger, manifest)
+            elapsed = time.perf_counter() - started_at
+            logger.info("Built %s stubs in %.3fs", submodule.import_name, elapsed)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                _build_package_stubs_worker,
+                submodule,
+                logger.level,
+                _get_directory_manifest(manifest or {}, submodule.import_name),
+            )
+            for submodule in submodules
+        ]
+        for submodule, future in zip(submodules, futures):
+            records, elapsed, submodule_manifest = future.result()
+            if manifest is not None:
+                manifest.update(submodule_manifest)
+            for record in records:
+                record.name = logger.name
+                logger.handle(record)
+            logger.info("Built %s stubs in %.3fs", submodule.import_name, elapsed)
+
+
 def log_install_info(logger: logging.Logger) -> None:
     active_submodules: List[Submodule] = [i for i in SUBMODULES if i.is_active]
     if not active_submodules:
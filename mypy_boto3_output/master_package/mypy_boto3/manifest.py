@@ -0,0 +1,90 @@
+"""
+Versioned manifest of generated service stubs index.
+"""
+import json
+import pathlib
+from typing import Any, Dict, Iterable, List, Optional
+
+MANIFEST_VERSION = 1
+
+# generated file path relative to ROOT_PATH -> {"sha256": ..., "mtime_ns": ...}
+FileManifest = Dict[str, Dict[str, Any]]
+
+
+class Manifest:
+    """
+    Active services, installed stubs versions and generated files hashes.
+
+    `used` limits generated overloads to services referenced by project sources,
+    None means all active services.
+    """
+
+    def __init__(
+        self,
+        active: Optional[Iterable[str]] = None,
+        installed: Optional[Dict[str, Optional[str]]] = None,
+        files: Optional[FileManifest] = None,
+        used: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.active: List[str] = sorted(active or [])
+        self.installed: Dict[str, Optional[str]] = dict(installed or {})
+        self.files: FileManifest = dict(files or {})
+        self.used: Optional[List[str]] = None if used is None else sorted(used)
+
+    @classmethod
+    def load(cls, path: pathlib.Path, legacy_cache_path: pathlib.Path) -> "Manifest":
+        """
+        Load manifest, migrating active services from legacy `cache.txt`.
+        """
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+            except ValueError:
+                data = {}
+            if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+                return cls(
+                    active=data.get("active"),
+                    installed=data.get("installed"),
+                    files=data.get("files"),
+                    used=data.get("used"),
+                )
+            return cls()
+
+        if legacy_cache_path.exists():
+            cache_key = legacy_cache_path.read_text()
+            return cls(active=[i for i in cache_key.split(",") if i])
+        return cls()
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "active": sorted(self.active),
+                "installed": self.installed,
+                "files": self.files,
+                "used": self.used,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+
+    def save(self, path: pathlib.Path) -> bool:
+        """
+        Write manifest if it changed. Returns True if file was written.
+        """
+        text = self.to_json()
+        if path.exists() and path.read_text() == text:
+            return False
+        path.write_text(text)
+        return True
+
+    def get_directory_files(self, import_name: str) -> FileManifest:
+        prefix = "{}/".format(import_name)
+        return {key: value for key, value in self.files.items() if key.startswith(prefix)}
+
+    def forget_directory(self, import_name: str) -> None:
+        """
+        Drop file entries of a removed service directory.
+        """
+        for key in self.get_directory_files(import_name):
+            del self.files[key]
@@ -0,0 +1,106 @@
+"""
+Discover boto3 services referenced by project sources.
+"""
+import ast
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Set
+
+FACTORY_NAMES = {"client", "resource"}
+SKIP_DIRECTORIES = {
+    ".git",
+    ".hg",
+    ".mypy_cache",
+    ".tox",
+    ".nox",
+    ".venv",
+    "venv",
+    "node_modules",
+    "__pycache__",
+}
+
+
+def _get_literal_string(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    # Python < 3.8 parses string literals as ast.Str
+    if type(node).__name__ == "Str":
+        return getattr(node, "s", None)
+    return None
+
+
+def _get_service_name(node: ast.Call) -> Optional[str]:
+    """
+    Get literal service name of `boto3.client("...")`-like call.
+
+    Matches `boto3.client`, `boto3.resource`, `Session().client`,
+    `session.resource` and bare `client`/`resource` imported from boto3.
+    """
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        name = func.attr
+    elif isinstance(func, ast.Name):
+        name = func.id
+    else:
+        return None
+    if name not in FACTORY_NAMES:
+        return None
+
+    if node.args:
+        return _get_literal_string(node.args[0])
+    for keyword in node.keywords:
+        if keyword.arg == "service_name":
+            return _get_literal_string(keyword.value)
+    return None
+
+
+def scan_file_usage(path: str) -> Set[str]:
+    """
+    Collect literal service names passed to boto3 client/resource factories.
+    """
+    try:
+        with open(path, "rb") as source_file:
+            tree = ast.parse(source_file.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    service_names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            service_name = _get_service_name(node)
+            if service_name:
+                service_names.add(service_name)
+    return service_names
+
+
+def iter_source_paths(paths: Iterable[str]) -> List[str]:
+    source_paths: List[str] = []
+    for path in paths:
+        if os.path.isfile(path):
+            source_paths.append(path)
+            continue
+        for dir_path, dir_names, file_names in os.walk(path):
+            dir_names[:] = [i for i in dir_names if i not in SKIP_DIRECTORIES]
+            source_paths.extend(
+                os.path.join(dir_path, i) for i in file_names if i.endswith((".py", ".pyi"))
+            )
+    return sorted(source_paths)
+
+
+def scan_service_usage(paths: Iterable[pathlib.Path], jobs: Optional[int] = None) -> Set[str]:
+    """
+    Scan project sources on a process pool for referenced boto3 service names.
+    """
+    source_paths = iter_source_paths(str(i) for i in paths)
+    service_names: Set[str] = set()
+    if jobs == 1 or len(source_paths) < 2:
+        for source_path in source_paths:
+            service_names.update(scan_file_usage(source_path))
+        return service_names
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunk_size = max(1, len(source_paths) // ((jobs or os.cpu_count() or 1) * 4))
+        for file_service_names in executor.map(scan_file_usage, source_paths, chunksize=chunk_size):
+            service_names.update(file_service_names)
+    return service_names
@@ -16,18 +16,9 @@ from typing import Any, Dict, Mapping, Sequence, Type
 
 from botocore.client import BaseClient, ClientMeta
 
-from .type_defs import (
-    AssumeRoleResponseTypeDef,
-    AssumeRoleWithSAMLResponseTypeDef,
-    AssumeRoleWithWebIdentityResponseTypeDef,
-    DecodeAuthorizationMessageResponseTypeDef,
-    GetAccessKeyInfoResponseTypeDef,
-    GetCallerIdentityResponseTypeDef,
-    GetFederationTokenResponseTypeDef,
-    GetSessionTokenResponseTypeDef,
-    PolicyDescriptorTypeTypeDef,
-    TagTypeDef,
-)
+# type definitions are built on first attribute access of `type_defs`,
+# annotations name them through the module so they resolve at runtime too
+from . import type_defs
 
 __all__ = ("STSClient",)
 
@@ -71,16 +62,16 @@ class STSClient(BaseClient):
         *,
         RoleArn: str,
         RoleSessionName: str,
-        PolicyArns: Sequence["PolicyDescriptorTypeTypeDef"] = ...,
+        PolicyArns: Sequence["type_defs.PolicyDescriptorTypeTypeDef"] = ...,
         Policy: str = ...,
         DurationSeconds: int = ...,
-        Tags: Sequence["TagTypeDef"] = ...,
+        Tags: Sequence["type_defs.TagTypeDef"] = ...,
         TransitiveTagKeys: Sequence[str] = ...,
         ExternalId: str = ...,
         SerialNumber: str = ...,
         TokenCode: str = ...,
         SourceIdentity: str = ...
-    ) -> AssumeRoleResponseTypeDef:
+    ) -> "type_defs.AssumeRoleResponseTypeDef":
         """
         Returns a set of temporary security credentials that you can use to access
         Amazon Web Services resources that you might not normally have access to.
@@ -95,10 +86,10 @@ class STSClient(BaseClient):
         RoleArn: str,
         PrincipalArn: str,
         SAMLAssertion: str,
-        PolicyArns: Sequence["PolicyDescriptorTypeTypeDef"] = ...,
+        PolicyArns: Sequence["type_defs.PolicyDescriptorTypeTypeDef"] = ...,
         Policy: str = ...,
         DurationSeconds: int = ...
-    ) -> AssumeRoleWithSAMLResponseTypeDef:
+    ) -> "type_defs.AssumeRoleWithSAMLResponseTypeDef":
         """
         Returns a set of temporary security credentials for users who have been
         authenticated via a SAML authentication response.
@@ -114,10 +105,10 @@ class STSClient(BaseClient):
         RoleSessionName: str,
         WebIdentityToken: str,
         ProviderId: str = ...,
-        PolicyArns: Sequence["PolicyDescriptorTypeTypeDef"] = ...,
+        PolicyArns: Sequence["type_defs.PolicyDescriptorTypeTypeDef"] = ...,
         Policy: str = ...,
         DurationSeconds: int = ...
-    ) -> AssumeRoleWithWebIdentityResponseTypeDef:
+    ) -> "type_defs.AssumeRoleWithWebIdentityResponseTypeDef":
         """
         Returns a set of temporary security credentials for users who have been
         authenticated in a mobile or web application with a web identity provider.
@@ -136,7 +127,7 @@ class STSClient(BaseClient):
 
     def decode_authorization_message(
         self, *, EncodedMessage: str
-    ) -> DecodeAuthorizationMessageResponseTypeDef:
+    ) -> "type_defs.DecodeAuthorizationMessageResponseTypeDef":
         """
         Decodes additional information about the authorization status of a request from
         an encoded message returned in response to an Amazon Web Services request.
@@ -159,7 +150,9 @@ class STSClient(BaseClient):
         [Show boto3-stubs documentation](https://vemel.github.io/boto3_stubs_docs/mypy_boto3_sts/client.html#generate_presigned_url)
         """
 
-    def get_access_key_info(self, *, AccessKeyId: str) -> GetAccessKeyInfoResponseTypeDef:
+    def get_access_key_info(
+        self, *, AccessKeyId: str
+    ) -> "type_defs.GetAccessKeyInfoResponseTypeDef":
         """
         Returns the account identifier for the specified access key ID.
 
@@ -167,7 +160,7 @@ class STSClient(BaseClient):
         [Show boto3-stubs documentation](https://vemel.github.io/boto3_stubs_docs/mypy_boto3_sts/client.html#get_access_key_info)
         """
 
-    def get_caller_identity(self) -> GetCallerIdentityResponseTypeDef:
+    def get_caller_identity(self) -> "type_defs.GetCallerIdentityResponseTypeDef":
         """
         Returns details about the IAM user or role whose credentials are used to call
         the operation.
@@ -181,10 +174,10 @@ class STSClient(BaseClient):
         *,
         Name: str,
         Policy: str = ...,
-        PolicyArns: Sequence["PolicyDescriptorTypeTypeDef"] = ...,
+        PolicyArns: Sequence["type_defs.PolicyDescriptorTypeTypeDef"] = ...,
         DurationSeconds: int = ...,
-        Tags: Sequence["TagTypeDef"] = ...
-    ) -> GetFederationTokenResponseTypeDef:
+        Tags: Sequence["type_defs.TagTypeDef"] = ...
+    ) -> "type_defs.GetFederationTokenResponseTypeDef":
         """
         Returns a set of temporary security credentials (consisting of an access key ID,
         a secret access key, and a security token) for a federated user.
@@ -195,7 +188,7 @@ class STSClient(BaseClient):
 
     def get_session_token(
         self, *, DurationSeconds: int = ..., SerialNumber: str = ..., TokenCode: str = ...
-    ) -> GetSessionTokenResponseTypeDef:
+    ) -> "type_defs.GetSessionTokenResponseTypeDef":
         """
         Returns a set of temporary credentials for an Amazon Web Services account or IAM
         user.
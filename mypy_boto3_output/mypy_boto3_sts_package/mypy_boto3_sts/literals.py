@@ -12,6 +12,7 @@ Usage::
     ```
 """
 import sys
+from typing import Any, Callable, Dict, List
 
 if sys.version_info >= (3, 8):
     from typing import Literal
@@ -21,305 +22,338 @@ else:
 
 __all__ = ("ServiceName",)
 
+# literal name -> function building it, literals are built on first attribute access
+_BUILDERS: Dict[str, Callable[[], Any]] = {}
 
-ServiceName = Literal[
-    "accessanalyzer",
-    "account",
-    "acm",
-    "acm-pca",
-    "alexaforbusiness",
-    "amp",
-    "amplify",
-    "amplifybackend",
-    "amplifyuibuilder",
-    "apigateway",
-    "apigatewaymanagementapi",
-    "apigatewayv2",
-    "appconfig",
-    "appconfigdata",
-    "appflow",
-    "appintegrations",
-    "application-autoscaling",
-    "application-insights",
-    "applicationcostprofiler",
-    "appmesh",
-    "apprunner",
-    "appstream",
-    "appsync",
-    "athena",
-    "auditmanager",
-    "autoscaling",
-    "autoscaling-plans",
-    "backup",
-    "backup-gateway",
-    "batch",
-    "braket",
-    "budgets",
-    "ce",
-    "chime",
-    "chime-sdk-identity",
-    "chime-sdk-meetings",
-    "chime-sdk-messaging",
-    "cloud9",
-    "cloudcontrol",
-    "clouddirectory",
-    "cloudformation",
-    "cloudfront",
-    "cloudhsm",
-    "cloudhsmv2",
-    "cloudsearch",
-    "cloudsearchdomain",
-    "cloudtrail",
-    "cloudwatch",
-    "codeartifact",
-    "codebuild",
-    "codecommit",
-    "codedeploy",
-    "codeguru-reviewer",
-    "codeguruprofiler",
-    "codepipeline",
-    "codestar",
-    "codestar-connections",
-    "codestar-notifications",
-    "cognito-identity",
-    "cognito-idp",
-    "cognito-sync",
-    "comprehend",
-    "comprehendmedical",
-    "compute-optimizer",
-    "config",
-    "connect",
-    "connect-contact-lens",
-    "connectparticipant",
-    "cur",
-    "customer-profiles",
-    "databrew",
-    "dataexchange",
-    "datapipeline",
-    "datasync",
-    "dax",
-    "detective",
-    "devicefarm",
-    "devops-guru",
-    "directconnect",
-    "discovery",
-    "dlm",
-    "dms",
-    "docdb",
-    "drs",
-    "ds",
-    "dynamodb",
-    "dynamodbstreams",
-    "ebs",
-    "ec2",
-    "ec2-instance-connect",
-    "ecr",
-    "ecr-public",
-    "ecs",
-    "efs",
-    "eks",
-    "elastic-inference",
-    "elasticache",
-    "elasticbeanstalk",
-    "elastictranscoder",
-    "elb",
-    "elbv2",
-    "emr",
-    "emr-containers",
-    "es",
-    "events",
-    "evidently",
-    "finspace",
-    "finspace-data",
-    "firehose",
-    "fis",
-    "fms",
-    "forecast",
-    "forecastquery",
-    "frauddetector",
-    "fsx",
-    "gamelift",
-    "glacier",
-    "globalaccelerator",
-    "glue",
-    "grafana",
-    "greengrass",
-    "greengrassv2",
-    "groundstation",
-    "guardduty",
-    "health",
-    "healthlake",
-    "honeycode",
-    "iam",
-    "identitystore",
-    "imagebuilder",
-    "importexport",
-    "inspector",
-    "inspector2",
-    "iot",
-    "iot-data",
-    "iot-jobs-data",
-    "iot1click-devices",
-    "iot1click-projects",
-    "iotanalytics",
-    "iotdeviceadvisor",
-    "iotevents",
-    "iotevents-data",
-    "iotfleethub",
-    "iotsecuretunneling",
-    "iotsitewise",
-    "iotthingsgraph",
-    "iottwinmaker",
-    "iotwireless",
-    "ivs",
-    "kafka",
-    "kafkaconnect",
-    "kendra",
-    "kinesis",
-    "kinesis-video-archived-media",
-    "kinesis-video-media",
-    "kinesis-video-signaling",
-    "kinesisanalytics",
-    "kinesisanalyticsv2",
-    "kinesisvideo",
-    "kms",
-    "lakeformation",
-    "lambda",
-    "lex-models",
-    "lex-runtime",
-    "lexv2-models",
-    "lexv2-runtime",
-    "license-manager",
-    "lightsail",
-    "location",
-    "logs",
-    "lookoutequipment",
-    "lookoutmetrics",
-    "lookoutvision",
-    "machinelearning",
-    "macie",
-    "macie2",
-    "managedblockchain",
-    "marketplace-catalog",
-    "marketplace-entitlement",
-    "marketplacecommerceanalytics",
-    "mediaconnect",
-    "mediaconvert",
-    "medialive",
-    "mediapackage",
-    "mediapackage-vod",
-    "mediastore",
-    "mediastore-data",
-    "mediatailor",
-    "memorydb",
-    "meteringmarketplace",
-    "mgh",
-    "mgn",
-    "migration-hub-refactor-spaces",
-    "migrationhub-config",
-    "migrationhubstrategy",
-    "mobile",
-    "mq",
-    "mturk",
-    "mwaa",
-    "neptune",
-    "network-firewall",
-    "networkmanager",
-    "nimble",
-    "opensearch",
-    "opsworks",
-    "opsworkscm",
-    "organizations",
-    "outposts",
-    "panorama",
-    "personalize",
-    "personalize-events",
-    "personalize-runtime",
-    "pi",
-    "pinpoint",
-    "pinpoint-email",
-    "pinpoint-sms-voice",
-    "polly",
-    "pricing",
-    "proton",
-    "qldb",
-    "qldb-session",
-    "quicksight",
-    "ram",
-    "rbin",
-    "rds",
-    "rds-data",
-    "redshift",
-    "redshift-data",
-    "rekognition",
-    "resiliencehub",
-    "resource-groups",
-    "resourcegroupstaggingapi",
-    "robomaker",
-    "route53",
-    "route53-recovery-cluster",
-    "route53-recovery-control-config",
-    "route53-recovery-readiness",
-    "route53domains",
-    "route53resolver",
-    "rum",
-    "s3",
-    "s3control",
-    "s3outposts",
-    "sagemaker",
-    "sagemaker-a2i-runtime",
-    "sagemaker-edge",
-    "sagemaker-featurestore-runtime",
-    "sagemaker-runtime",
-    "savingsplans",
-    "schemas",
-    "sdb",
-    "secretsmanager",
-    "securityhub",
-    "serverlessrepo",
-    "service-quotas",
-    "servicecatalog",
-    "servicecatalog-appregistry",
-    "servicediscovery",
-    "ses",
-    "sesv2",
-    "shield",
-    "signer",
-    "sms",
-    "sms-voice",
-    "snow-device-management",
-    "snowball",
-    "sns",
-    "sqs",
-    "ssm",
-    "ssm-contacts",
-    "ssm-incidents",
-    "sso",
-    "sso-admin",
-    "sso-oidc",
-    "stepfunctions",
-    "storagegateway",
-    "sts",
-    "support",
-    "swf",
-    "synthetics",
-    "textract",
-    "timestream-query",
-    "timestream-write",
-    "transcribe",
-    "transfer",
-    "translate",
-    "voice-id",
-    "waf",
-    "waf-regional",
-    "wafv2",
-    "wellarchitected",
-    "wisdom",
-    "workdocs",
-    "worklink",
-    "workmail",
-    "workmailmessageflow",
-    "workspaces",
-    "workspaces-web",
-    "xray",
-]
+
+def _lazy(builder: Callable[[], Any]) -> Callable[[], Any]:
+    _BUILDERS[builder.__name__[len("_build_") :]] = builder
+    return builder
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build literal on first access and cache it as a module attribute.
+    """
+    value = globals().get(name)
+    if value is not None:
+        return value
+    builder = _BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    return globals().setdefault(name, builder())
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_BUILDERS))
+
+
+@_lazy
+def _build_ServiceName() -> Any:
+    return Literal[
+        "accessanalyzer",
+        "account",
+        "acm",
+        "acm-pca",
+        "alexaforbusiness",
+        "amp",
+        "amplify",
+        "amplifybackend",
+        "amplifyuibuilder",
+        "apigateway",
+        "apigatewaymanagementapi",
+        "apigatewayv2",
+        "appconfig",
+        "appconfigdata",
+        "appflow",
+        "appintegrations",
+        "application-autoscaling",
+        "application-insights",
+        "applicationcostprofiler",
+        "appmesh",
+        "apprunner",
+        "appstream",
+        "appsync",
+        "athena",
+        "auditmanager",
+        "autoscaling",
+        "autoscaling-plans",
+        "backup",
+        "backup-gateway",
+        "batch",
+        "braket",
+        "budgets",
+        "ce",
+        "chime",
+        "chime-sdk-identity",
+        "chime-sdk-meetings",
+        "chime-sdk-messaging",
+        "cloud9",
+        "cloudcontrol",
+        "clouddirectory",
+        "cloudformation",
+        "cloudfront",
+        "cloudhsm",
+        "cloudhsmv2",
+        "cloudsearch",
+        "cloudsearchdomain",
+        "cloudtrail",
+        "cloudwatch",
+        "codeartifact",
+        "codebuild",
+        "codecommit",
+        "codedeploy",
+        "codeguru-reviewer",
+        "codeguruprofiler",
+        "codepipeline",
+        "codestar",
+        "codestar-connections",
+        "codestar-notifications",
+        "cognito-identity",
+        "cognito-idp",
+        "cognito-sync",
+        "comprehend",
+        "comprehendmedical",
+        "compute-optimizer",
+        "config",
+        "connect",
+        "connect-contact-lens",
+        "connectparticipant",
+        "cur",
+        "customer-profiles",
+        "databrew",
+        "dataexchange",
+        "datapipeline",
+        "datasync",
+        "dax",
+        "detective",
+        "devicefarm",
+        "devops-guru",
+        "directconnect",
+        "discovery",
+        "dlm",
+        "dms",
+        "docdb",
+        "drs",
+        "ds",
+        "dynamodb",
+        "dynamodbstreams",
+        "ebs",
+        "ec2",
+        "ec2-instance-connect",
+        "ecr",
+        "ecr-public",
+        "ecs",
+        "efs",
+        "eks",
+        "elastic-inference",
+        "elasticache",
+        "elasticbeanstalk",
+        "elastictranscoder",
+        "elb",
+        "elbv2",
+        "emr",
+        "emr-containers",
+        "es",
+        "events",
+        "evidently",
+        "finspace",
+        "finspace-data",
+        "firehose",
+        "fis",
+        "fms",
+        "forecast",
+        "forecastquery",
+        "frauddetector",
+        "fsx",
+        "gamelift",
+        "glacier",
+        "globalaccelerator",
+        "glue",
+        "grafana",
+        "greengrass",
+        "greengrassv2",
+        "groundstation",
+        "guardduty",
+        "health",
+        "healthlake",
+        "honeycode",
+        "iam",
+        "identitystore",
+        "imagebuilder",
+        "importexport",
+        "inspector",
+        "inspector2",
+        "iot",
+        "iot-data",
+        "iot-jobs-data",
+        "iot1click-devices",
+        "iot1click-projects",
+        "iotanalytics",
+        "iotdeviceadvisor",
+        "iotevents",
+        "iotevents-data",
+        "iotfleethub",
+        "iotsecuretunneling",
+        "iotsitewise",
+        "iotthingsgraph",
+        "iottwinmaker",
+        "iotwireless",
+        "ivs",
+        "kafka",
+        "kafkaconnect",
+        "kendra",
+        "kinesis",
+        "kinesis-video-archived-media",
+        "kinesis-video-media",
+        "kinesis-video-signaling",
+        "kinesisanalytics",
+        "kinesisanalyticsv2",
+        "kinesisvideo",
+        "kms",
+        "lakeformation",
+        "lambda",
+        "lex-models",
+        "lex-runtime",
+        "lexv2-models",
+        "lexv2-runtime",
+        "license-manager",
+        "lightsail",
+        "location",
+        "logs",
+        "lookoutequipment",
+        "lookoutmetrics",
+        "lookoutvision",
+        "machinelearning",
+        "macie",
+        "macie2",
+        "managedblockchain",
+        "marketplace-catalog",
+        "marketplace-entitlement",
+        "marketplacecommerceanalytics",
+        "mediaconnect",
+        "mediaconvert",
+        "medialive",
+        "mediapackage",
+        "mediapackage-vod",
+        "mediastore",
+        "mediastore-data",
+        "mediatailor",
+        "memorydb",
+        "meteringmarketplace",
+        "mgh",
+        "mgn",
+        "migration-hub-refactor-spaces",
+        "migrationhub-config",
+        "migrationhubstrategy",
+        "mobile",
+        "mq",
+        "mturk",
+        "mwaa",
+        "neptune",
+        "network-firewall",
+        "networkmanager",
+        "nimble",
+        "opensearch",
+        "opsworks",
+        "opsworkscm",
+        "organizations",
+        "outposts",
+        "panorama",
+        "personalize",
+        "personalize-events",
+        "personalize-runtime",
+        "pi",
+        "pinpoint",
+        "pinpoint-email",
+        "pinpoint-sms-voice",
+        "polly",
+        "pricing",
+        "proton",
+        "qldb",
+        "qldb-session",
+        "quicksight",
+        "ram",
+        "rbin",
+        "rds",
+        "rds-data",
+        "redshift",
+        "redshift-data",
+        "rekognition",
+        "resiliencehub",
+        "resource-groups",
+        "resourcegroupstaggingapi",
+        "robomaker",
+        "route53",
+        "route53-recovery-cluster",
+        "route53-recovery-control-config",
+        "route53-recovery-readiness",
+        "route53domains",
+        "route53resolver",
+        "rum",
+        "s3",
+        "s3control",
+        "s3outposts",
+        "sagemaker",
+        "sagemaker-a2i-runtime",
+        "sagemaker-edge",
+        "sagemaker-featurestore-runtime",
+        "sagemaker-runtime",
+        "savingsplans",
+        "schemas",
+        "sdb",
+        "secretsmanager",
+        "securityhub",
+        "serverlessrepo",
+        "service-quotas",
+        "servicecatalog",
+        "servicecatalog-appregistry",
+        "servicediscovery",
+        "ses",
+        "sesv2",
+        "shield",
+        "signer",
+        "sms",
+        "sms-voice",
+        "snow-device-management",
+        "snowball",
+        "sns",
+        "sqs",
+        "ssm",
+        "ssm-contacts",
+        "ssm-incidents",
+        "sso",
+        "sso-admin",
+        "sso-oidc",
+        "stepfunctions",
+        "storagegateway",
+        "sts",
+        "support",
+        "swf",
+        "synthetics",
+        "textract",
+        "timestream-query",
+        "timestream-write",
+        "transcribe",
+        "transfer",
+        "translate",
+        "voice-id",
+        "waf",
+        "waf-regional",
+        "wafv2",
+        "wellarchitected",
+        "wisdom",
+        "workdocs",
+        "worklink",
+        "workmail",
+        "workmailmessageflow",
+        "workspaces",
+        "workspaces-web",
+        "xray",
+    ]
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, build all literals on import
+    for _name in list(_BUILDERS):
+        __getattr__(_name)
@@ -12,8 +12,9 @@ Usage::
     ```
 """
 import sys
+import types
 from datetime import datetime
-from typing import Any, Dict, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Sequence
 
 if sys.version_info >= (3, 8):
     from typing import TypedDict
@@ -45,272 +46,415 @@ __all__ = (
     "TagTypeDef",
 )
 
-_RequiredAssumeRoleRequestRequestTypeDef = TypedDict(
-    "_RequiredAssumeRoleRequestRequestTypeDef",
-    {
-        "RoleArn": str,
-        "RoleSessionName": str,
-    },
-)
-_OptionalAssumeRoleRequestRequestTypeDef = TypedDict(
-    "_OptionalAssumeRoleRequestRequestTypeDef",
-    {
-        "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
-        "Policy": str,
-        "DurationSeconds": int,
-        "Tags": Sequence["TagTypeDef"],
-        "TransitiveTagKeys": Sequence[str],
-        "ExternalId": str,
-        "SerialNumber": str,
-        "TokenCode": str,
-        "SourceIdentity": str,
-    },
-    total=False,
-)
-
-
-class AssumeRoleRequestRequestTypeDef(
-    _RequiredAssumeRoleRequestRequestTypeDef, _OptionalAssumeRoleRequestRequestTypeDef
-):
-    pass
-
-
-AssumeRoleResponseTypeDef = TypedDict(
-    "AssumeRoleResponseTypeDef",
-    {
-        "Credentials": "CredentialsTypeDef",
-        "AssumedRoleUser": "AssumedRoleUserTypeDef",
-        "PackedPolicySize": int,
-        "SourceIdentity": str,
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-_RequiredAssumeRoleWithSAMLRequestRequestTypeDef = TypedDict(
-    "_RequiredAssumeRoleWithSAMLRequestRequestTypeDef",
-    {
-        "RoleArn": str,
-        "PrincipalArn": str,
-        "SAMLAssertion": str,
-    },
-)
-_OptionalAssumeRoleWithSAMLRequestRequestTypeDef = TypedDict(
-    "_OptionalAssumeRoleWithSAMLRequestRequestTypeDef",
-    {
-        "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
-        "Policy": str,
-        "DurationSeconds": int,
-    },
-    total=False,
-)
-
-
-class AssumeRoleWithSAMLRequestRequestTypeDef(
-    _RequiredAssumeRoleWithSAMLRequestRequestTypeDef,
-    _OptionalAssumeRoleWithSAMLRequestRequestTypeDef,
-):
-    pass
-
-
-AssumeRoleWithSAMLResponseTypeDef = TypedDict(
-    "AssumeRoleWithSAMLResponseTypeDef",
-    {
-        "Credentials": "CredentialsTypeDef",
-        "AssumedRoleUser": "AssumedRoleUserTypeDef",
-        "PackedPolicySize": int,
-        "Subject": str,
-        "SubjectType": str,
-        "Issuer": str,
-        "Audience": str,
-        "NameQualifier": str,
-        "SourceIdentity": str,
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-_RequiredAssumeRoleWithWebIdentityRequestRequestTypeDef = TypedDict(
-    "_RequiredAssumeRoleWithWebIdentityRequestRequestTypeDef",
-    {
-        "RoleArn": str,
-        "RoleSessionName": str,
-        "WebIdentityToken": str,
-    },
-)
-_OptionalAssumeRoleWithWebIdentityRequestRequestTypeDef = TypedDict(
-    "_OptionalAssumeRoleWithWebIdentityRequestRequestTypeDef",
-    {
-        "ProviderId": str,
-        "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
-        "Policy": str,
-        "DurationSeconds": int,
-    },
-    total=False,
-)
-
-
-class AssumeRoleWithWebIdentityRequestRequestTypeDef(
-    _RequiredAssumeRoleWithWebIdentityRequestRequestTypeDef,
-    _OptionalAssumeRoleWithWebIdentityRequestRequestTypeDef,
-):
-    pass
-
-
-AssumeRoleWithWebIdentityResponseTypeDef = TypedDict(
-    "AssumeRoleWithWebIdentityResponseTypeDef",
-    {
-        "Credentials": "CredentialsTypeDef",
-        "SubjectFromWebIdentityToken": str,
-        "AssumedRoleUser": "AssumedRoleUserTypeDef",
-        "PackedPolicySize": int,
-        "Provider": str,
-        "Audience": str,
-        "SourceIdentity": str,
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-AssumedRoleUserTypeDef = TypedDict(
-    "AssumedRoleUserTypeDef",
-    {
-        "AssumedRoleId": str,
-        "Arn": str,
-    },
-)
-
-CredentialsTypeDef = TypedDict(
-    "CredentialsTypeDef",
-    {
-        "AccessKeyId": str,
-        "SecretAccessKey": str,
-        "SessionToken": str,
-        "Expiration": datetime,
-    },
-)
-
-DecodeAuthorizationMessageRequestRequestTypeDef = TypedDict(
-    "DecodeAuthorizationMessageRequestRequestTypeDef",
-    {
-        "EncodedMessage": str,
-    },
-)
-
-DecodeAuthorizationMessageResponseTypeDef = TypedDict(
-    "DecodeAuthorizationMessageResponseTypeDef",
-    {
-        "DecodedMessage": str,
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-FederatedUserTypeDef = TypedDict(
-    "FederatedUserTypeDef",
-    {
-        "FederatedUserId": str,
-        "Arn": str,
-    },
-)
-
-GetAccessKeyInfoRequestRequestTypeDef = TypedDict(
-    "GetAccessKeyInfoRequestRequestTypeDef",
-    {
-        "AccessKeyId": str,
-    },
-)
-
-GetAccessKeyInfoResponseTypeDef = TypedDict(
-    "GetAccessKeyInfoResponseTypeDef",
-    {
-        "Account": str,
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-GetCallerIdentityResponseTypeDef = TypedDict(
-    "GetCallerIdentityResponseTypeDef",
-    {
-        "UserId": str,
-        "Account": str,
-        "Arn": str,
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-_RequiredGetFederationTokenRequestRequestTypeDef = TypedDict(
-    "_RequiredGetFederationTokenRequestRequestTypeDef",
-    {
-        "Name": str,
-    },
-)
-_OptionalGetFederationTokenRequestRequestTypeDef = TypedDict(
-    "_OptionalGetFederationTokenRequestRequestTypeDef",
-    {
-        "Policy": str,
-        "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
-        "DurationSeconds": int,
-        "Tags": Sequence["TagTypeDef"],
-    },
-    total=False,
-)
-
-
-class GetFederationTokenRequestRequestTypeDef(
-    _RequiredGetFederationTokenRequestRequestTypeDef,
-    _OptionalGetFederationTokenRequestRequestTypeDef,
-):
-    pass
-
-
-GetFederationTokenResponseTypeDef = TypedDict(
-    "GetFederationTokenResponseTypeDef",
-    {
-        "Credentials": "CredentialsTypeDef",
-        "FederatedUser": "FederatedUserTypeDef",
-        "PackedPolicySize": int,
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-GetSessionTokenRequestRequestTypeDef = TypedDict(
-    "GetSessionTokenRequestRequestTypeDef",
-    {
-        "DurationSeconds": int,
-        "SerialNumber": str,
-        "TokenCode": str,
-    },
-    total=False,
-)
-
-GetSessionTokenResponseTypeDef = TypedDict(
-    "GetSessionTokenResponseTypeDef",
-    {
-        "Credentials": "CredentialsTypeDef",
-        "ResponseMetadata": "ResponseMetadataTypeDef",
-    },
-)
-
-PolicyDescriptorTypeTypeDef = TypedDict(
-    "PolicyDescriptorTypeTypeDef",
-    {
-        "arn": str,
-    },
-    total=False,
-)
-
-ResponseMetadataTypeDef = TypedDict(
-    "ResponseMetadataTypeDef",
-    {
-        "RequestId": str,
-        "HostId": str,
-        "HTTPStatusCode": int,
-        "HTTPHeaders": Dict[str, Any],
-        "RetryAttempts": int,
-    },
-)
-
-TagTypeDef = TypedDict(
-    "TagTypeDef",
-    {
-        "Key": str,
-        "Value": str,
-    },
-)
+# type name -> function building it, types are built on first attribute access
+_BUILDERS: Dict[str, Callable[[], Any]] = {}
+
+
+def _lazy(builder: Callable[[], Any]) -> Callable[[], Any]:
+    _BUILDERS[builder.__name__[len("_build_") :]] = builder
+    return builder
+
+
+def _merge_typed_dicts(name: str, required_name: str, optional_name: str) -> Any:
+    """
+    Equivalent of `class Name(_RequiredName, _OptionalName): pass`.
+    """
+    return types.new_class(
+        name,
+        (__getattr__(required_name), __getattr__(optional_name)),
+        exec_body=lambda namespace: namespace.update(__module__=__name__),
+    )
+
+
+def _forward_references(annotation: Any) -> Iterator[str]:
+    """
+    Names of type definitions referenced as strings in `annotation`.
+    """
+    if hasattr(annotation, "__forward_arg__"):
+        yield annotation.__forward_arg__
+    for argument in getattr(annotation, "__args__", None) or ():
+        yield from _forward_references(argument)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build type definition on first access and cache it as a module attribute.
+    """
+    value = globals().get(name)
+    if value is not None:
+        return value
+    builder = _BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = globals().setdefault(name, builder())
+    # `typing.get_type_hints` resolves forward references against module globals,
+    # build referenced type definitions too. cycles end as names are already set
+    for annotation in getattr(value, "__annotations__", {}).values():
+        for reference in _forward_references(annotation):
+            if reference not in globals():
+                __getattr__(reference)
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_BUILDERS))
+
+
+@_lazy
+def _build__RequiredAssumeRoleRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_RequiredAssumeRoleRequestRequestTypeDef",
+        {
+            "RoleArn": str,
+            "RoleSessionName": str,
+        },
+    )
+
+
+@_lazy
+def _build__OptionalAssumeRoleRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_OptionalAssumeRoleRequestRequestTypeDef",
+        {
+            "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
+            "Policy": str,
+            "DurationSeconds": int,
+            "Tags": Sequence["TagTypeDef"],
+            "TransitiveTagKeys": Sequence[str],
+            "ExternalId": str,
+            "SerialNumber": str,
+            "TokenCode": str,
+            "SourceIdentity": str,
+        },
+        total=False,
+    )
+
+
+@_lazy
+def _build_AssumeRoleRequestRequestTypeDef() -> Any:
+    return _merge_typed_dicts(
+        "AssumeRoleRequestRequestTypeDef",
+        "_RequiredAssumeRoleRequestRequestTypeDef",
+        "_OptionalAssumeRoleRequestRequestTypeDef",
+    )
+
+
+@_lazy
+def _build_AssumeRoleResponseTypeDef() -> Any:
+    return TypedDict(
+        "AssumeRoleResponseTypeDef",
+        {
+            "Credentials": "CredentialsTypeDef",
+            "AssumedRoleUser": "AssumedRoleUserTypeDef",
+            "PackedPolicySize": int,
+            "SourceIdentity": str,
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build__RequiredAssumeRoleWithSAMLRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_RequiredAssumeRoleWithSAMLRequestRequestTypeDef",
+        {
+            "RoleArn": str,
+            "PrincipalArn": str,
+            "SAMLAssertion": str,
+        },
+    )
+
+
+@_lazy
+def _build__OptionalAssumeRoleWithSAMLRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_OptionalAssumeRoleWithSAMLRequestRequestTypeDef",
+        {
+            "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
+            "Policy": str,
+            "DurationSeconds": int,
+        },
+        total=False,
+    )
+
+
+@_lazy
+def _build_AssumeRoleWithSAMLRequestRequestTypeDef() -> Any:
+    return _merge_typed_dicts(
+        "AssumeRoleWithSAMLRequestRequestTypeDef",
+        "_RequiredAssumeRoleWithSAMLRequestRequestTypeDef",
+        "_OptionalAssumeRoleWithSAMLRequestRequestTypeDef",
+    )
+
+
+@_lazy
+def _build_AssumeRoleWithSAMLResponseTypeDef() -> Any:
+    return TypedDict(
+        "AssumeRoleWithSAMLResponseTypeDef",
+        {
+            "Credentials": "CredentialsTypeDef",
+            "AssumedRoleUser": "AssumedRoleUserTypeDef",
+            "PackedPolicySize": int,
+            "Subject": str,
+            "SubjectType": str,
+            "Issuer": str,
+            "Audience": str,
+            "NameQualifier": str,
+            "SourceIdentity": str,
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build__RequiredAssumeRoleWithWebIdentityRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_RequiredAssumeRoleWithWebIdentityRequestRequestTypeDef",
+        {
+            "RoleArn": str,
+            "RoleSessionName": str,
+            "WebIdentityToken": str,
+        },
+    )
+
+
+@_lazy
+def _build__OptionalAssumeRoleWithWebIdentityRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_OptionalAssumeRoleWithWebIdentityRequestRequestTypeDef",
+        {
+            "ProviderId": str,
+            "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
+            "Policy": str,
+            "DurationSeconds": int,
+        },
+        total=False,
+    )
+
+
+@_lazy
+def _build_AssumeRoleWithWebIdentityRequestRequestTypeDef() -> Any:
+    return _merge_typed_dicts(
+        "AssumeRoleWithWebIdentityRequestRequestTypeDef",
+        "_RequiredAssumeRoleWithWebIdentityRequestRequestTypeDef",
+        "_OptionalAssumeRoleWithWebIdentityRequestRequestTypeDef",
+    )
+
+
+@_lazy
+def _build_AssumeRoleWithWebIdentityResponseTypeDef() -> Any:
+    return TypedDict(
+        "AssumeRoleWithWebIdentityResponseTypeDef",
+        {
+            "Credentials": "CredentialsTypeDef",
+            "SubjectFromWebIdentityToken": str,
+            "AssumedRoleUser": "AssumedRoleUserTypeDef",
+            "PackedPolicySize": int,
+            "Provider": str,
+            "Audience": str,
+            "SourceIdentity": str,
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build_AssumedRoleUserTypeDef() -> Any:
+    return TypedDict(
+        "AssumedRoleUserTypeDef",
+        {
+            "AssumedRoleId": str,
+            "Arn": str,
+        },
+    )
+
+
+@_lazy
+def _build_CredentialsTypeDef() -> Any:
+    return TypedDict(
+        "CredentialsTypeDef",
+        {
+            "AccessKeyId": str,
+            "SecretAccessKey": str,
+            "SessionToken": str,
+            "Expiration": datetime,
+        },
+    )
+
+
+@_lazy
+def _build_DecodeAuthorizationMessageRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "DecodeAuthorizationMessageRequestRequestTypeDef",
+        {
+            "EncodedMessage": str,
+        },
+    )
+
+
+@_lazy
+def _build_DecodeAuthorizationMessageResponseTypeDef() -> Any:
+    return TypedDict(
+        "DecodeAuthorizationMessageResponseTypeDef",
+        {
+            "DecodedMessage": str,
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build_FederatedUserTypeDef() -> Any:
+    return TypedDict(
+        "FederatedUserTypeDef",
+        {
+            "FederatedUserId": str,
+            "Arn": str,
+        },
+    )
+
+
+@_lazy
+def _build_GetAccessKeyInfoRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "GetAccessKeyInfoRequestRequestTypeDef",
+        {
+            "AccessKeyId": str,
+        },
+    )
+
+
+@_lazy
+def _build_GetAccessKeyInfoResponseTypeDef() -> Any:
+    return TypedDict(
+        "GetAccessKeyInfoResponseTypeDef",
+        {
+            "Account": str,
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build_GetCallerIdentityResponseTypeDef() -> Any:
+    return TypedDict(
+        "GetCallerIdentityResponseTypeDef",
+        {
+            "UserId": str,
+            "Account": str,
+            "Arn": str,
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build__RequiredGetFederationTokenRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_RequiredGetFederationTokenRequestRequestTypeDef",
+        {
+            "Name": str,
+        },
+    )
+
+
+@_lazy
+def _build__OptionalGetFederationTokenRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "_OptionalGetFederationTokenRequestRequestTypeDef",
+        {
+            "Policy": str,
+            "PolicyArns": Sequence["PolicyDescriptorTypeTypeDef"],
+            "DurationSeconds": int,
+            "Tags": Sequence["TagTypeDef"],
+        },
+        total=False,
+    )
+
+
+@_lazy
+def _build_GetFederationTokenRequestRequestTypeDef() -> Any:
+    return _merge_typed_dicts(
+        "GetFederationTokenRequestRequestTypeDef",
+        "_RequiredGetFederationTokenRequestRequestTypeDef",
+        "_OptionalGetFederationTokenRequestRequestTypeDef",
+    )
+
+
+@_lazy
+def _build_GetFederationTokenResponseTypeDef() -> Any:
+    return TypedDict(
+        "GetFederationTokenResponseTypeDef",
+        {
+            "Credentials": "CredentialsTypeDef",
+            "FederatedUser": "FederatedUserTypeDef",
+            "PackedPolicySize": int,
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build_GetSessionTokenRequestRequestTypeDef() -> Any:
+    return TypedDict(
+        "GetSessionTokenRequestRequestTypeDef",
+        {
+            "DurationSeconds": int,
+            "SerialNumber": str,
+            "TokenCode": str,
+        },
+        total=False,
+    )
+
+
+@_lazy
+def _build_GetSessionTokenResponseTypeDef() -> Any:
+    return TypedDict(
+        "GetSessionTokenResponseTypeDef",
+        {
+            "Credentials": "CredentialsTypeDef",
+            "ResponseMetadata": "ResponseMetadataTypeDef",
+        },
+    )
+
+
+@_lazy
+def _build_PolicyDescriptorTypeTypeDef() -> Any:
+    return TypedDict(
+        "PolicyDescriptorTypeTypeDef",
+        {
+            "arn": str,
+        },
+        total=False,
+    )
+
+
+@_lazy
+def _build_ResponseMetadataTypeDef() -> Any:
+    return TypedDict(
+        "ResponseMetadataTypeDef",
+        {
+            "RequestId": str,
+            "HostId": str,
+            "HTTPStatusCode": int,
+            "HTTPHeaders": Dict[str, Any],
+            "RetryAttempts": int,
+        },
+    )
+
+
+@_lazy
+def _build_TagTypeDef() -> Any:
+    return TypedDict(
+        "TagTypeDef",
+        {
+            "Key": str,
+            "Value": str,
+        },
+    )
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, build all type definitions on import
+    for _name in list(_BUILDERS):
+        __getattr__(_name)
@@ -1,12 +1,19 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Dict, Optional
 
 import boto3
-from loguru import logger
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
 
-from constants import AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN
+from clock import CLOCK_SKEW, ClockSkew
+from credentials import SessionCredentials
+from log import logger
+from rate_limiter import is_throttling_error
+from replay_guard import ReplayGuard
 
 if TYPE_CHECKING:
+    from client_cache import ClientCache
+    from rate_limiter import STSRateLimiter
     from mypy_boto3_output.mypy_boto3_sts_package.mypy_boto3_sts import STSClient
     from mypy_boto3_output.mypy_boto3_sts_package.mypy_boto3_sts.type_defs import (
         GetSessionTokenResponseTypeDef,
@@ -17,27 +24,54 @@ class AWSClient:
     """AWS client for sts authentication"""
 
     client: STSClient
-    response: GetSessionTokenResponseTypeDef
+    # seconds spent in each phase of refresh
+    timings: Dict[str, float]
 
     ONE_HOUR = 3600
     # 15 mins
     MINIMUM_DURATION = 900
     MAXIMUM_DURAION = ONE_HOUR * 36
 
-    def __init__(self, mfa_arn: str, token_code: str) -> None:
-        self.client = boto3.client("sts")
+    def __init__(
+        self,
+        mfa_arn: str,
+        token_code: str,
+        rate_limiter: Optional[STSRateLimiter] = None,
+        client_cache: Optional[ClientCache] = None,
+        replay_guard: Optional[ReplayGuard] = None,
+        clock_skew: ClockSkew = CLOCK_SKEW,
+    ) -> None:
+        started_at = time.perf_counter()
+        if client_cache is None:
+            self.client = boto3.client("sts")
+        else:
+            self.client = client_cache.client("sts")
+        self.timings = {"client_init": time.perf_counter() - started_at}
         self.mfa_arn = mfa_arn
         self.token_code = token_code
         self.current_duration = self.MAXIMUM_DURAION
+        self.rate_limiter = rate_limiter
+        self.replay_guard = replay_guard or ReplayGuard(mfa_arn)
+        self.clock_skew = clock_skew
+
+    @property
+    def limiter_key(self):
+        """sts throttles per account, account id is part of mfa arn"""
+        account_id = self.mfa_arn.split(":")[4]
+        return account_id, self.client.meta.region_name
 
-    def request_session_token(self):
+    def request_session_token(self) -> SessionCredentials:
         """request session config using aws sts client"""
         logger.info(
-            f"set current duration about {self.current_duration/self.ONE_HOUR} hour."
+            "set current duration about {} hour.", self.current_duration / self.ONE_HOUR
         )
 
+        # a reused code fails here instead of after a sts round trip
+        self.replay_guard.claim(self.token_code)
+        started_at = time.perf_counter()
         try:
-            self.response = self.client.get_session_token(
+            response = self.call_sts(
+                self.client.get_session_token,
                 DurationSeconds=self.MAXIMUM_DURAION,
                 SerialNumber=self.mfa_arn,
                 TokenCode=self.token_code,
@@ -45,20 +79,47 @@ class AWSClient:
         except Exception as err:
             # TODO error is not specified
             logger.error("failed get response using sts client.")
+            if self.never_reached_sts(err):
+                self.replay_guard.release(self.token_code)
             raise err
         else:
-            logger.debug(f"get response {self.response}")
-            return self.parse_response()
+            self.timings["sts_call"] = time.perf_counter() - started_at
+            # expiration is aws time, measure how far local clock is off
+            try:
+                self.clock_skew.record_response(response, time.time())
+            except OSError as err:
+                # skew state or its lock is unwritable, session is valid anyway
+                logger.warning("failed record clock skew: {}", err)
+            logger.debug("get response {}", response)
+            started_at = time.perf_counter()
+            credentials = self.parse_response(response)
+            self.timings["parse"] = time.perf_counter() - started_at
+            # response is released here, only parsed credentials are kept
+            return credentials
+
+    @staticmethod
+    def never_reached_sts(err: Exception) -> bool:
+        """
+        true when sts did not see the token code, so it may be retried.
+        a read timeout or any other error may come after sts consumed the code
+        """
+        # connect, proxy and tls failures, read timeouts are no subclass
+        return isinstance(err, BotocoreConnectionError) or is_throttling_error(err)
 
-    def parse_response(self):
-        """parsing config from response and return its values"""
-        credentials = self.response["Credentials"]
+    def call_sts(self, operation, **kwargs):
+        """call sts operation, within rate limits when limiter is given"""
+        if self.rate_limiter is None:
+            return operation(**kwargs)
+        return self.rate_limiter.call(self.limiter_key, operation, **kwargs)
 
-        expiration = credentials["Expiration"]
-        logger.debug(f"this session expired at {expiration}")
+    @property
+    def endpoint_url(self) -> str:
+        return self.client.meta.endpoint_url
 
-        return {
-            AWS_ACCESS_KEY_ID: credentials["AccessKeyId"],
-            AWS_SECRET_ACCESS_KEY: credentials["SecretAccessKey"],
-            AWS_SESSION_TOKEN: credentials["SessionToken"],
-        }
+    def parse_response(
+        self, response: GetSessionTokenResponseTypeDef
+    ) -> SessionCredentials:
+        """parsing credentials from response"""
+        credentials = SessionCredentials.from_response(response)
+        logger.debug("this session expired at {}", credentials.expiration)
+        return credentials
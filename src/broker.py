@@ -0,0 +1,258 @@
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional
+
+from client_cache import ClientCache
+from clock import CLOCK_SKEW, corrected_now
+from constants import MFA_AUTH_HOME
+from credentials import SessionCredentials
+from log import logger
+from rate_limiter import STSRateLimiter
+from session_cache import SessionCache
+from telemetry import percentile
+from unattended import can_refresh_unattended, refresh_unattended
+
+# request: op (u8) | body length (u32) | body
+# response: status (u8) | payload length (u32) | payload
+HEADER = struct.Struct(">BI")
+
+OP_GET_CREDENTIALS = 1
+OP_STATS = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+DEFAULT_SOCKET_PATH = MFA_AUTH_HOME / "broker.sock"
+
+
+def encode_frame(status: int, payload: bytes) -> bytes:
+    return HEADER.pack(status, len(payload)) + payload
+
+
+class BrokerError(Exception):
+    """error response of credential broker"""
+
+
+def is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
+
+
+class ProfileEntry:
+    """serialized response of one profile and when it has to be reloaded"""
+
+    __slots__ = ("credentials", "frame", "reload_at")
+
+    def __init__(self, credentials: SessionCredentials, reload_at: float) -> None:
+        self.credentials = credentials
+        # aws cli and sdks compare expiration with local clock
+        local_credentials = credentials.with_expiration(
+            CLOCK_SKEW.to_local(credentials.expiration)
+        )
+        self.frame = encode_frame(STATUS_OK, local_credentials.to_json().encode())
+        self.reload_at = reload_at
+
+
+class CredentialBroker:
+    """
+    serve mfa sessions of many profiles to local processes.
+
+    each profile response is serialized once and served from memory until
+    the session has to be refreshed, handling a request is a dict lookup
+    and a monotonic clock read.
+    """
+
+    # refresh sessions 15 mins before expiration, like botocore does
+    REFRESH_MARGIN = 900
+    # sessions within refresh margin which broker can not refresh itself are
+    # served as they are, look for a refresh by another process this often
+    RELOAD_INTERVAL = 30
+    LATENCY_SAMPLES = 10000
+
+    entries: Dict[str, ProfileEntry]
+    # seconds spent handling recent requests
+    latencies: Deque[float]
+
+    def __init__(
+        self,
+        auto_refresh: bool = False,
+        rate_limiter: Optional[STSRateLimiter] = None,
+    ) -> None:
+        """
+        with `auto_refresh`, profiles with an unattended token provider are
+        refreshed by broker. other profiles are served only while sessions
+        refreshed by other processes last, expired ones answer an error
+        """
+        self.auto_refresh = auto_refresh
+        self.rate_limiter = rate_limiter or STSRateLimiter()
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.client_cache = ClientCache(max_size=1)
+        self.latencies = deque(maxlen=self.LATENCY_SAMPLES)
+        self.stats_lock = threading.Lock()
+        self.request_count = 0
+
+    def get_frame(self, profile: str) -> bytes:
+        entry = self.entries.get(profile)
+        if entry is not None and time.monotonic() < entry.reload_at:
+            return entry.frame
+
+        with self.lock:
+            entry = self.entries.get(profile)
+            if entry is None or time.monotonic() >= entry.reload_at:
+                credentials = self.load(profile)
+                entry = ProfileEntry(credentials, self.get_reload_at(credentials))
+                self.entries[profile] = entry
+        return entry.frame
+
+    def get_reload_at(self, credentials: SessionCredentials) -> float:
+        """monotonic time when serialized response of session is invalidated"""
+        expires_in = credentials.expiration - corrected_now()
+        expires_in_seconds = expires_in.total_seconds()
+        if expires_in_seconds > self.REFRESH_MARGIN:
+            return time.monotonic() + expires_in_seconds - self.REFRESH_MARGIN
+        return time.monotonic() + min(self.RELOAD_INTERVAL, expires_in_seconds)
+
+    def load(self, profile: str) -> SessionCredentials:
+        """session from cache, refreshed when it expires within refresh margin"""
+        credentials = SessionCache(profile).load()
+        if SessionCache.is_fresh(credentials, margin=self.REFRESH_MARGIN):
+            return credentials
+
+        if not self.auto_refresh or not can_refresh_unattended(profile):
+            if SessionCache.is_fresh(credentials):
+                return credentials
+            raise BrokerError(f"session of [{profile}] is expired")
+
+        return refresh_unattended(
+            profile,
+            margin=self.REFRESH_MARGIN,
+            client_cache=self.client_cache,
+            rate_limiter=self.rate_limiter,
+        )
+
+    def handle(self, op: int, body: bytes) -> bytes:
+        try:
+            if op == OP_GET_CREDENTIALS:
+                return self.get_frame(body.decode())
+            if op == OP_STATS:
+                return encode_frame(STATUS_OK, json.dumps(self.stats()).encode())
+            raise BrokerError(f"unknown op {op}")
+        except Exception as err:
+            logger.error("broker request failed: {}", err)
+            return encode_frame(STATUS_ERROR, str(err).encode())
+
+    def record_latency(self, duration: float) -> None:
+        with self.stats_lock:
+            self.request_count += 1
+            self.latencies.append(duration)
+
+    def stats(self) -> dict:
+        """request count and handling time percentiles of recent requests"""
+        with self.stats_lock:
+            latencies = sorted(self.latencies)
+        return {
+            "requests": self.request_count,
+            "profiles": sorted(self.entries),
+            "p50": percentile(latencies, 50),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+        }
+
+
+class BrokerRequestHandler(socketserver.BaseRequestHandler):
+    """answer requests of one connection until client closes it"""
+
+    def handle(self) -> None:
+        broker: CredentialBroker = self.server.broker
+        reader = self.request.makefile("rb")
+        while True:
+            header = reader.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return
+            op, length = HEADER.unpack(header)
+            body = reader.read(length)
+
+            started_at = time.perf_counter()
+            frame = broker.handle(op, body)
+            self.request.sendall(frame)
+            broker.record_latency(time.perf_counter() - started_at)
+
+
+class BrokerServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, broker: CredentialBroker) -> None:
+        self.broker = broker
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.is_socket():
+            if is_listening(self.socket_path):
+                raise BrokerError(f"broker is already running on {self.socket_path}")
+            # left by a broker which was killed
+            self.socket_path.unlink()
+        # only current user may connect
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), BrokerRequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+        stats = self.broker.stats()
+        logger.info(
+            "broker served {} requests, p50 {:.1f}us p99 {:.1f}us",
+            stats["requests"],
+            (stats["p50"] or 0) * 1e6,
+            (stats["p99"] or 0) * 1e6,
+        )
+
+
+class BrokerClient:
+    """persistent connection to credential broker"""
+
+    def __init__(self, socket_path: Path = DEFAULT_SOCKET_PATH) -> None:
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(str(socket_path))
+        self.reader = self.socket.makefile("rb")
+
+    def request(self, op: int, body: bytes = b"") -> bytes:
+        self.socket.sendall(HEADER.pack(op, len(body)) + body)
+        status, length = HEADER.unpack(self.reader.read(HEADER.size))
+        payload = self.reader.read(length)
+        if status != STATUS_OK:
+            raise BrokerError(payload.decode())
+        return payload
+
+    def get_json(self, profile: str) -> bytes:
+        """`credential_process` json of profile"""
+        return self.request(OP_GET_CREDENTIALS, profile.encode())
+
+    def get_credentials(self, profile: str) -> SessionCredentials:
+        return SessionCredentials.from_json(self.get_json(profile))
+
+    def stats(self) -> dict:
+        return json.loads(self.request(OP_STATS))
+
+    def close(self) -> None:
+        self.reader.close()
+        self.socket.close()
+
+    def __enter__(self) -> "BrokerClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+from aws_client import AWSClient
+from client_cache import ClientCache
+from log import logger
+from rate_limiter import STSRateLimiter
+from session_cache import SessionCache
+from unattended import can_refresh_unattended, refresh_unattended
+
+
+def run_concurrently(
+    refresh: Callable, items: Sequence, rate_limiter: STSRateLimiter
+) -> List:
+    """
+    call `refresh` for every item, failed call has its exception in place of result.
+    concurrency is bounded by the adaptive limit of each account,
+    worker count is only an upper bound
+    """
+
+    def run(item):
+        try:
+            return refresh(item)
+        except Exception as err:
+            return err
+
+    with ThreadPoolExecutor(max_workers=rate_limiter.max_concurrency) as executor:
+        results = list(executor.map(run, items))
+
+    failed = sum(isinstance(result, Exception) for result in results)
+    logger.info("refreshed {} sessions, {} failed.", len(results) - failed, failed)
+    rate_limiter.log_report()
+    return results
+
+
+def refresh_many(
+    aws_clients: Sequence[AWSClient],
+    rate_limiter: Optional[STSRateLimiter] = None,
+) -> List:
+    """
+    request session tokens for many clients as fast as sts allows.
+
+    result list keeps order of `aws_clients`, failed refresh has its exception
+    in place of session config.
+    """
+    rate_limiter = rate_limiter or STSRateLimiter()
+    for aws_client in aws_clients:
+        aws_client.rate_limiter = rate_limiter
+    return run_concurrently(
+        lambda aws_client: aws_client.request_session_token(), aws_clients, rate_limiter
+    )
+
+
+def get_refreshable_profiles(profiles: Sequence[str], margin: int) -> List[str]:
+    """profiles which expire within `margin` and have an unattended token provider"""
+    refreshable = []
+    for profile in profiles:
+        credentials = SessionCache(profile).load()
+        if SessionCache.is_fresh(credentials, margin=margin):
+            continue
+        if not can_refresh_unattended(profile):
+            logger.debug("[{}] has no unattended token provider, skip", profile)
+            continue
+        refreshable.append(profile)
+    return refreshable
+
+
+def refresh_profiles(
+    profiles: Sequence[str],
+    rate_limiter: Optional[STSRateLimiter] = None,
+    margin: Optional[int] = None,
+    client_cache: Optional[ClientCache] = None,
+) -> List:
+    """
+    refresh sessions of profiles with their unattended token providers,
+    concurrently and within sts limits of `rate_limiter`.
+
+    result list keeps order of `profiles`, failed refresh has its exception
+    in place of session credentials.
+    """
+    rate_limiter = rate_limiter or STSRateLimiter()
+
+    def refresh(profile: str):
+        try:
+            return refresh_unattended(
+                profile,
+                margin=margin,
+                client_cache=client_cache,
+                rate_limiter=rate_limiter,
+            )
+        except Exception as err:
+            logger.error("refresh of [{}] failed: {}", profile, err)
+            raise err
+
+    return run_concurrently(refresh, profiles, rate_limiter)
@@ -0,0 +1,106 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+
+def get_config_key(config: Optional[Config]) -> Hashable:
+    """botocore Config is not hashable, key it by user provided options"""
+    if config is None:
+        return None
+    options = config._user_provided_options
+    return tuple(sorted((name, repr(value)) for name, value in options.items()))
+
+
+def get_credential_identity(session: boto3.Session) -> Optional[str]:
+    """clients are bound to credentials, key them by access key id"""
+    credentials = session.get_credentials()
+    if credentials is None:
+        return None
+    return credentials.get_frozen_credentials().access_key
+
+
+class ClientCache:
+    """
+    thread safe LRU cache of boto3 clients and resources.
+
+    building a client loads service models and registers event handlers,
+    hot code which asks for the same client repeatedly should reuse it.
+    clients are shared between threads, resources are not thread safe
+    so they are cached per thread.
+    """
+
+    DEFAULT_MAX_SIZE = 32
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(
+        self, kind: str, service_name: str, session: boto3.Session, kwargs: dict
+    ) -> Tuple:
+        """
+        key by service, region, endpoint, credential identity and config.
+        other factory arguments such as api version or explicit credentials
+        are part of the key as well
+        """
+        options = tuple(
+            sorted(
+                (name, value)
+                for name, value in kwargs.items()
+                if name not in ("region_name", "config")
+            )
+        )
+        key = (
+            kind,
+            service_name,
+            kwargs.get("region_name") or session.region_name,
+            get_credential_identity(session),
+            get_config_key(kwargs.get("config")),
+            options,
+        )
+        if kind == "resource":
+            key += (threading.get_ident(),)
+        return key
+
+    def get_or_create(
+        self, kind: str, service_name: str, session=None, **kwargs
+    ) -> Any:
+        session = session or boto3._get_default_session()
+        key = self.get_key(kind, service_name, session, kwargs)
+
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        # build outside of lock, creating a client takes milliseconds
+        factory = session.client if kind == "client" else session.resource
+        created = factory(service_name, **kwargs)
+
+        with self.lock:
+            # another thread may have built the same client meanwhile
+            created = self.entries.setdefault(key, created)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        return created
+
+    def client(self, service_name: str, session=None, **kwargs) -> Any:
+        """cached `boto3.client` / `Session.client`"""
+        return self.get_or_create("client", service_name, session, **kwargs)
+
+    def resource(self, service_name: str, session=None, **kwargs) -> Any:
+        """cached `boto3.resource` / `Session.resource`"""
+        return self.get_or_create("resource", service_name, session, **kwargs)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,127 @@
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+from constants import MFA_AUTH_HOME
+from log import logger
+from settings import FILE_CACHE, ParsedFileCache
+
+
+def parse_skew_file(path: Path) -> dict:
+    try:
+        with open(path) as skew_file:
+            state = json.load(skew_file)
+        return {"skew": float(state["skew"]), "samples": int(state["samples"])}
+    except (OSError, ValueError, KeyError, TypeError) as err:
+        logger.warning("ignore unreadable clock skew state {}: {}", path, err)
+        return {"skew": 0.0, "samples": 0}
+
+
+class ClockSkew:
+    """
+    smoothed offset of aws clock from local clock, `aws time = local time + skew`.
+
+    every sts response carries a `Date` header, each one is a sample of an
+    exponentially weighted moving average kept in a state file shared by all
+    processes. expiration in sts responses is aws time, compare it with
+    `now()` instead of local time so drifting local clocks neither refresh
+    too early nor serve expired sessions.
+    """
+
+    skew_path: Path
+
+    SKEW_PATH = MFA_AUTH_HOME / "clock_skew.json"
+    # weight of newest sample, the rest is kept from previous estimate
+    SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        skew_path: Optional[Path] = None,
+        file_cache: ParsedFileCache = FILE_CACHE,
+    ) -> None:
+        self.skew_path = Path(skew_path or self.SKEW_PATH)
+        self.file_cache = file_cache
+        self.lock = threading.Lock()
+
+    def state(self) -> dict:
+        default = {"skew": 0.0, "samples": 0}
+        return self.file_cache.get(self.skew_path, parse_skew_file, default)
+
+    @property
+    def skew(self) -> float:
+        """seconds local clock is behind aws, negative when it is ahead"""
+        return self.state()["skew"]
+
+    def now(self) -> datetime:
+        """current aws time"""
+        return datetime.now(timezone.utc) + timedelta(seconds=self.skew)
+
+    def to_local(self, aws_time: datetime) -> datetime:
+        """aws time as local clock shows it, for consumers comparing with local time"""
+        return aws_time - timedelta(seconds=self.skew)
+
+    def record_response(self, response: dict, received_at: float) -> None:
+        """take a sample from `Date` header of a botocore response"""
+        date = response.get("ResponseMetadata", {}).get("HTTPHeaders", {}).get("date")
+        if not date:
+            return
+        try:
+            server_time = parsedate_to_datetime(date)
+        except (TypeError, ValueError):
+            logger.warning("ignore unparsable response date {!r}", date)
+            return
+        # header has whole seconds, server time is half a second later on average
+        self.record(server_time.timestamp() + 0.5 - received_at)
+
+    @property
+    def lock_path(self) -> Path:
+        return self.skew_path.with_suffix(".lock")
+
+    def record(self, sample: float) -> float:
+        """
+        update estimate with a skew sample in seconds and return new estimate.
+        updates of threads and processes are serialized, none loses a sample
+        """
+        self.skew_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                # read under lock, cached state may miss a concurrent update
+                state = {"skew": 0.0, "samples": 0}
+                if self.skew_path.exists():
+                    state = parse_skew_file(self.skew_path)
+                if state["samples"]:
+                    skew = state["skew"] + self.SMOOTHING * (sample - state["skew"])
+                else:
+                    skew = sample
+                self.save({"skew": skew, "samples": state["samples"] + 1})
+            finally:
+                os.close(lock_fd)
+        logger.debug("clock skew sample {:.3f}s, estimate {:.3f}s", sample, skew)
+        return skew
+
+    def save(self, state: dict) -> None:
+        """replace state file atomically, readers never see a half written file"""
+        fd, temp_path = tempfile.mkstemp(dir=self.skew_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as skew_file:
+                json.dump(state, skew_file)
+            os.replace(temp_path, self.skew_path)
+        except Exception as err:
+            os.unlink(temp_path)
+            raise err
+
+
+CLOCK_SKEW = ClockSkew()
+
+
+def corrected_now() -> datetime:
+    """current aws time, local time corrected by measured clock skew"""
+    return CLOCK_SKEW.now()
@@ -1,20 +1,44 @@
-from cmath import log
 import configparser
+import fcntl
+import os
+import threading
+import time
 from pathlib import Path
 
-from loguru import logger
+from constants import MFA_AUTH_HOME
+from credentials import SessionCredentials
+from log import logger
 
-from constants import AWS_SESSION_TOKEN, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
+# serializes threads of this process, flock only serializes processes
+CREDENTIALS_LOCK = threading.Lock()
+
+
+class CredentialsFileLock:
+    """cross process exclusive lock around read, update and write of credentials file"""
+
+    LOCK_PATH = MFA_AUTH_HOME / "locks" / "credentials.lock"
+
+    def __enter__(self) -> "CredentialsFileLock":
+        self.LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_fd = os.open(self.LOCK_PATH, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self.lock_fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+        os.close(self.lock_fd)
 
 
 class ConfigEditor:
     config_name: str
-    config_response: any
+    credentials: SessionCredentials
+    # seconds spent writing credentials file
+    write_duration: float
 
-    def __init__(self, config_name: str, config_response) -> None:
+    def __init__(self, config_name: str, credentials: SessionCredentials) -> None:
         """This class highly depend on aws_client"""
         self.config_name = config_name
-        self.config_response = config_response
+        self.credentials = credentials
 
     def edit(self) -> None:
         """
@@ -23,28 +47,25 @@ class ConfigEditor:
         """
         config = configparser.ConfigParser()
         config_path = f"{Path.home()}/.aws/credentials"
-        config.read(config_path)
-
-        if self.config_name in config.sections():
-            logger.info(
-                f"next job will overwrite exist config data. section [{self.config_name}]"
-            )
-
-        config[self.config_name][AWS_ACCESS_KEY_ID] = self.config_response[
-            AWS_ACCESS_KEY_ID
-        ]
-        config[self.config_name][AWS_SECRET_ACCESS_KEY] = self.config_response[
-            AWS_SECRET_ACCESS_KEY
-        ]
-        config[self.config_name][AWS_SESSION_TOKEN] = self.config_response[
-            AWS_SESSION_TOKEN
-        ]
-
-        try:
-            config_file = open(config_path, "w")
-            config.write(config_file)
-        except Exception as err:
-            logger.error(f"failed write config to {config_path}")
-            raise err
-        else:
-            logger.info(f"succeed write config file to {config_path}")
+        # concurrent refreshes of other profiles rewrite the same file
+        with CREDENTIALS_LOCK, CredentialsFileLock():
+            config.read(config_path)
+
+            if self.config_name in config.sections():
+                logger.info(
+                    "next job will overwrite exist config data. section [{}]",
+                    self.config_name,
+                )
+
+            config[self.config_name].update(self.credentials.to_config_section())
+
+            started_at = time.perf_counter()
+            try:
+                with open(config_path, "w") as config_file:
+                    config.write(config_file)
+            except Exception as err:
+                logger.error("failed write config to {}", config_path)
+                raise err
+            else:
+                self.write_duration = time.perf_counter() - started_at
+                logger.info("succeed write config file to {}", config_path)
@@ -1,3 +1,9 @@
+from pathlib import Path
+
 AWS_ACCESS_KEY_ID = "aws_access_key_id"
 AWS_SECRET_ACCESS_KEY = "aws_secret_access_key"
 AWS_SESSION_TOKEN = "aws_session_token"
+AWS_SESSION_EXPIRATION = "aws_session_expiration"
+
+# local state of this tool (session cache, locks, ...)
+MFA_AUTH_HOME = Path.home() / ".aws" / "mfa-auth"
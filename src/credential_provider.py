@@ -0,0 +1,103 @@
+from typing import Callable, Optional
+
+from botocore.credentials import CredentialProvider, RefreshableCredentials
+
+from aws_client import AWSClient
+from client_cache import ClientCache
+from clock import CLOCK_SKEW
+from credentials import SessionCredentials
+from log import logger
+from session_cache import SessionCache
+from shared_credentials import SharedCredentials
+from single_flight import refresh_single_flight
+
+
+class MFASessionCredentialProvider(CredentialProvider):
+    """
+    botocore credential provider backed by the mfa session cache.
+
+    credentials are refreshed in memory through `AWSClient.request_session_token`
+    so long running applications never re-read `~/.aws/credentials`.
+    """
+
+    METHOD = "mfa-session"
+    CANONICAL_NAME = "MFASession"
+
+    # botocore starts refreshing 15 mins before expiration,
+    # reuse a cached session only when it outlives that window
+    REFRESH_MARGIN = 900
+
+    def __init__(
+        self,
+        config_name: str,
+        mfa_arn: str,
+        token_code_provider: Callable[[], str],
+    ) -> None:
+        """
+        `token_code_provider` is called only when the cached session is expired
+        and must return a current mfa token code
+        """
+        self.config_name = config_name
+        self.mfa_arn = mfa_arn
+        self.token_code_provider = token_code_provider
+        self.session_cache = SessionCache(config_name)
+        self.shared_credentials: Optional[SharedCredentials] = None
+        # sts client is reused between refreshes of a long running application
+        self.client_cache = ClientCache(max_size=1)
+
+    def load(self):
+        """build refreshable credentials from cache, requesting a session if needed"""
+        return RefreshableCredentials.create_from_metadata(
+            metadata=self.refresh(),
+            refresh_using=self.refresh,
+            method=self.METHOD,
+        )
+
+    def refresh(self) -> dict:
+        """return credentials metadata, reusing cache while it is fresh"""
+        credentials = self.load_cached()
+
+        if not SessionCache.is_fresh(credentials, margin=self.REFRESH_MARGIN):
+            credentials = refresh_single_flight(
+                self.config_name, self.request_session, margin=self.REFRESH_MARGIN
+            )
+
+        # botocore compares expiry time with local clock
+        local_expiration = CLOCK_SKEW.to_local(credentials.expiration)
+        return credentials.with_expiration(local_expiration).to_metadata()
+
+    def load_cached(self) -> Optional[SessionCredentials]:
+        """
+        session published by refresh daemon in shared memory,
+        session cache file when no daemon publishes it
+        """
+        if self.shared_credentials is None:
+            self.shared_credentials = SharedCredentials.attach(self.config_name)
+        if self.shared_credentials is not None:
+            credentials = self.shared_credentials.read()
+            if SessionCache.is_fresh(credentials, margin=self.REFRESH_MARGIN):
+                return credentials
+        return self.session_cache.load()
+
+    def request_session(self) -> SessionCredentials:
+        """request new session from sts with a fresh token code"""
+        logger.info("refresh mfa session for [{}]", self.config_name)
+        aws_client = AWSClient(
+            mfa_arn=self.mfa_arn,
+            token_code=self.token_code_provider(),
+            client_cache=self.client_cache,
+        )
+        return aws_client.request_session_token()
+
+
+def install_credential_provider(
+    botocore_session, provider: MFASessionCredentialProvider
+) -> None:
+    """
+    insert provider at the head of botocore credential chain.
+
+    do not install it on the default boto3 session, `AWSClient` uses that one
+    with your long term credentials to call sts.
+    """
+    resolver = botocore_session.get_component("credential_provider")
+    resolver.insert_before("env", provider)
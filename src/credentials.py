@@ -0,0 +1,149 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Mapping, Tuple
+
+from constants import (
+    AWS_ACCESS_KEY_ID,
+    AWS_SECRET_ACCESS_KEY,
+    AWS_SESSION_EXPIRATION,
+    AWS_SESSION_TOKEN,
+)
+
+
+class SessionCredentials:
+    """
+    immutable mfa session credentials.
+
+    only the four credential fields are kept, sts response with its metadata
+    and headers can be released right after parsing. serializers reference
+    the same strings, nothing is copied.
+    """
+
+    __slots__ = ("access_key_id", "secret_access_key", "session_token", "expiration")
+
+    access_key_id: str
+    secret_access_key: str
+    session_token: str
+    expiration: datetime
+
+    def __init__(
+        self,
+        access_key_id: str,
+        secret_access_key: str,
+        session_token: str,
+        expiration: datetime,
+    ) -> None:
+        set_field = super().__setattr__
+        set_field("access_key_id", access_key_id)
+        set_field("secret_access_key", secret_access_key)
+        set_field("session_token", session_token)
+        set_field("expiration", expiration)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SessionCredentials):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __hash__(self) -> int:
+        return hash(self.as_tuple())
+
+    def __repr__(self) -> str:
+        # never leak secret or token into logs
+        return (
+            f"{type(self).__name__}(access_key_id={self.access_key_id!r}, "
+            f"expiration={self.expiration.isoformat()!r})"
+        )
+
+    def as_tuple(self) -> Tuple[str, str, str, datetime]:
+        return (
+            self.access_key_id,
+            self.secret_access_key,
+            self.session_token,
+            self.expiration,
+        )
+
+    @classmethod
+    def from_response(cls, response: Mapping[str, Any]) -> "SessionCredentials":
+        """parse `get_session_token` response"""
+        credentials = response["Credentials"]
+        return cls(
+            credentials["AccessKeyId"],
+            credentials["SecretAccessKey"],
+            credentials["SessionToken"],
+            credentials["Expiration"],
+        )
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, str]) -> "SessionCredentials":
+        """inverse of `to_dict`"""
+        return cls(
+            values[AWS_ACCESS_KEY_ID],
+            values[AWS_SECRET_ACCESS_KEY],
+            values[AWS_SESSION_TOKEN],
+            datetime.fromisoformat(values[AWS_SESSION_EXPIRATION]),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "SessionCredentials":
+        """inverse of `to_json`"""
+        values = json.loads(text)
+        return cls(
+            values["AccessKeyId"],
+            values["SecretAccessKey"],
+            values["SessionToken"],
+            datetime.fromisoformat(values["Expiration"]),
+        )
+
+    def with_expiration(self, expiration: datetime) -> "SessionCredentials":
+        return SessionCredentials(
+            self.access_key_id, self.secret_access_key, self.session_token, expiration
+        )
+
+    def to_dict(self) -> Dict[str, str]:
+        """credentials file keys with expiration, as kept in session cache"""
+        values = self.to_config_section()
+        values[AWS_SESSION_EXPIRATION] = self.expiration.isoformat()
+        return values
+
+    def to_config_section(self) -> Dict[str, str]:
+        """section of ~/.aws/credentials"""
+        return {
+            AWS_ACCESS_KEY_ID: self.access_key_id,
+            AWS_SECRET_ACCESS_KEY: self.secret_access_key,
+            AWS_SESSION_TOKEN: self.session_token,
+        }
+
+    def to_env(self) -> Dict[str, str]:
+        """environment variables understood by aws cli and sdks"""
+        return {
+            "AWS_ACCESS_KEY_ID": self.access_key_id,
+            "AWS_SECRET_ACCESS_KEY": self.secret_access_key,
+            "AWS_SESSION_TOKEN": self.session_token,
+        }
+
+    def to_json(self) -> str:
+        """`credential_process` output format of aws cli and sdks"""
+        return json.dumps(
+            {
+                "Version": 1,
+                "AccessKeyId": self.access_key_id,
+                "SecretAccessKey": self.secret_access_key,
+                "SessionToken": self.session_token,
+                "Expiration": self.expiration.isoformat(),
+            }
+        )
+
+    def to_metadata(self) -> Dict[str, str]:
+        """metadata of botocore `RefreshableCredentials`"""
+        return {
+            "access_key": self.access_key_id,
+            "secret_key": self.secret_access_key,
+            "token": self.session_token,
+            "expiry_time": self.expiration.isoformat(),
+        }
@@ -0,0 +1,105 @@
+import signal
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from bulk_refresh import get_refreshable_profiles, refresh_profiles
+from client_cache import ClientCache
+from log import logger
+from metrics_exporter import TextfileExporter
+from rate_limiter import STSRateLimiter
+from session_cache import SessionCache
+from shared_credentials import SharedCredentials
+
+
+class RefreshDaemon:
+    """
+    long running loop which keeps session health exported on a timer.
+    with `shared_memory`, cached sessions are published to shared memory
+    segments as well, see `SharedCredentials`. with `auto_refresh`, sessions
+    about to expire are refreshed when their profile has an unattended
+    token provider, e.g. `totp:<seed-file>`
+    """
+
+    DEFAULT_INTERVAL = 60
+    # refresh sessions 15 mins before expiration, like botocore does
+    REFRESH_MARGIN = 900
+
+    # config name -> published segment and cache mtime it was published from
+    published: Dict[str, Tuple[SharedCredentials, Optional[int]]]
+
+    def __init__(
+        self,
+        interval: int = DEFAULT_INTERVAL,
+        exporter: Optional[TextfileExporter] = None,
+        shared_memory: bool = False,
+        auto_refresh: bool = False,
+        rate_limiter: Optional[STSRateLimiter] = None,
+    ) -> None:
+        self.interval = interval
+        self.exporter = exporter
+        self.shared_memory = shared_memory
+        self.auto_refresh = auto_refresh
+        self.client_cache = ClientCache(max_size=1)
+        # kept across iterations, adaptive concurrency remembers throttling
+        self.rate_limiter = rate_limiter or STSRateLimiter()
+        self.published = {}
+
+    def run_once(self) -> None:
+        profiles = SessionCache.cached_config_names()
+        if self.auto_refresh:
+            self.refresh(profiles)
+        if self.shared_memory:
+            self.publish(profiles)
+        if self.exporter is not None:
+            self.exporter.export(profiles)
+
+    def refresh(self, profiles: List[str]) -> None:
+        """refresh sessions within refresh margin, one failure skips one profile"""
+        refreshable = get_refreshable_profiles(profiles, self.REFRESH_MARGIN)
+        if refreshable:
+            refresh_profiles(
+                refreshable,
+                rate_limiter=self.rate_limiter,
+                margin=self.REFRESH_MARGIN,
+                client_cache=self.client_cache,
+            )
+
+    def publish(self, profiles: List[str]) -> None:
+        """publish sessions which changed since last iteration"""
+        for profile in profiles:
+            session_cache = SessionCache(profile)
+            shared, published_mtime = self.published.get(profile, (None, None))
+            cache_mtime = session_cache.modified_at()
+            if shared is not None and cache_mtime == published_mtime:
+                continue
+
+            credentials = session_cache.load()
+            if credentials is None:
+                continue
+            if shared is None:
+                shared = SharedCredentials.create(profile)
+            shared.publish(credentials)
+            self.published[profile] = (shared, cache_mtime)
+            logger.info("published session of [{}] to shared memory", profile)
+
+    def unpublish(self) -> None:
+        for shared, _ in self.published.values():
+            shared.close()
+            shared.unlink()
+        self.published.clear()
+
+    def run(self) -> None:
+        logger.info("start daemon, run every {} seconds.", self.interval)
+        # service managers stop daemons with SIGTERM, clean up shared memory then
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            while True:
+                started_at = time.monotonic()
+                try:
+                    self.run_once()
+                except Exception as err:
+                    logger.error("daemon iteration failed: {}", err)
+                time.sleep(max(0.0, self.interval - (time.monotonic() - started_at)))
+        finally:
+            self.unpublish()
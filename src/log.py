@@ -0,0 +1,61 @@
+import re
+import sys
+
+from loguru import logger as _logger
+
+# patterns are compiled once at import, scrubbing runs on every emitted record
+
+# key/value pairs of secrets as they appear in response reprs, credentials
+# files, env vars, json and command lines
+SECRET_VALUE_PATTERN = re.compile(
+    r"(?i)((?:secret[_-]?access[_-]?key|secret[_-]?key|session[_-]?token|token[_-]?code"
+    r"|\btoken)"
+    r"""['"]?\s*[:=]\s*['"]?)[^'"\s,}]+"""
+)
+# sts session tokens which leaked without their key
+SESSION_TOKEN_PATTERN = re.compile(r"\b(?:FQoG|FwoG|IQoJ)[A-Za-z0-9/+=]{16,}")
+# keep last 4 characters so access keys and accounts are still recognizable
+ACCESS_KEY_ID_PATTERN = re.compile(r"\b(AKIA|ASIA)[A-Z0-9]{12}([A-Z0-9]{4})\b")
+ACCOUNT_ID_PATTERN = re.compile(r"(arn:aws[\w-]*:[\w-]*:[\w-]*:)\d{8}(\d{4})")
+
+REDACTED = "***"
+
+
+def redact(text: str) -> str:
+    """mask secrets, session tokens, access key ids and account ids in text"""
+    text = SECRET_VALUE_PATTERN.sub(rf"\1{REDACTED}", text)
+    text = SESSION_TOKEN_PATTERN.sub(REDACTED, text)
+    text = ACCESS_KEY_ID_PATTERN.sub(r"\1************\2", text)
+    return ACCOUNT_ID_PATTERN.sub(r"\1********\2", text)
+
+
+def redact_record(record: dict) -> None:
+    """
+    loguru patcher. patchers run only for records which pass the level check,
+    after the message is formatted, so filtered records cost no scrubbing
+    """
+    record["message"] = redact(record["message"])
+
+
+# use this logger instead of loguru one.
+# pass values as format arguments instead of f-strings, and wrap expensive
+# ones with `logger.opt(lazy=True)`, so nothing is formatted for a filtered level
+logger = _logger.patch(redact_record)
+
+
+def redacting_sink(message: str) -> None:
+    """
+    stderr sink which scrubs the fully rendered record. the patcher misses
+    tracebacks of `logger.exception` and `logger.opt(exception=...)`, those
+    are formatted by the handler after patching, with exception messages
+    that may carry secrets of failed sts responses
+    """
+    sys.stderr.write(redact(message))
+
+
+def setup_logging(level: str) -> None:
+    """replace loguru default stderr sink, which accepts every debug record"""
+    _logger.remove()
+    # no colors, escape codes would split secrets from their keys, and no
+    # variable values in tracebacks, those are printed without any key
+    _logger.add(redacting_sink, level=level, colorize=False, diagnose=False)
@@ -1,54 +1,321 @@
 from lib2to3.pgen2 import token
+import signal
+import sqlite3
+import sys
+import time
+
 import click
-from dotenv import dotenv_values
-from loguru import logger
 
 
 from aws_client import AWSClient
-from config_editor import ConfigEditor
+from broker import (
+    DEFAULT_SOCKET_PATH,
+    BrokerClient,
+    BrokerError,
+    BrokerServer,
+    CredentialBroker,
+)
+from bulk_refresh import get_refreshable_profiles, refresh_profiles
+from daemon import RefreshDaemon
+from log import logger, setup_logging
+from metrics_exporter import TextfileExporter
+from rate_limiter import STSRateLimiter
+from replay_guard import ReplayGuard
+from session_cache import SessionCache
+from session_refresh import refresh_and_record
+from settings import REQUIRED_SETTINGS, SETTINGS, SettingsLoader
+from single_flight import refresh_single_flight
+from telemetry import TelemetryStore
+from token_provider import TokenProviderError, get_token_provider
 
-config = {"aws_mfa_arn": "", "aws_token_code": "", "config_name": ""}
+config = {
+    "aws_mfa_arn": "",
+    "aws_token_code": "",
+    "config_name": "",
+    "token_provider": None,
+    "textfile_dir": None,
+    "sts_rate": STSRateLimiter.DEFAULT_RATE,
+    "sts_burst": STSRateLimiter.DEFAULT_BURST,
+}
 
 
-def read_local_env():
+def read_settings(cli_values: dict):
+    """merge cli flags, environment, `.env`, user config and profiles manifest"""
     global config
 
-    config["aws_mfa_arn"] = dotenv_values(".env")["AWS_MFA_ARN"]
-    logger.debug(f'read local mfa arn : {config["aws_mfa_arn"]}')
-    config["config_name"] = dotenv_values(".env")["CONFIG_NAME"]
+    config.update(SettingsLoader().load(cli_values))
+    logger.debug("read local mfa arn : {}", config["aws_mfa_arn"])
+
+
+def require_settings():
+    """settings needed to refresh a session"""
+    missing = [name for name in REQUIRED_SETTINGS if not config[name]]
+    if missing:
+        raise click.UsageError(
+            f"missing {', '.join(SETTINGS[name] for name in missing)}. "
+            "set in .env, environment, ~/.config/aws-mfa-auth or pass as option"
+        )
 
 
-def get_session_configuration():
-    """get response using default config profile"""
-    aws_client = AWSClient(
-        mfa_arn=config["aws_mfa_arn"], token_code=config["aws_token_code"]
+def refresh_session():
+    """request new session and write it to config file"""
+    return refresh_and_record(
+        config["config_name"],
+        lambda: AWSClient(
+            mfa_arn=config["aws_mfa_arn"], token_code=config["aws_token_code"]
+        ),
     )
-    return aws_client.request_session_token()
 
 
-def edit_config_file(config_response):
-    """editing config using parsed session response"""
-    config_editor = ConfigEditor(config["config_name"], config_response)
-    config_editor.edit()
+def get_rate_limiter() -> STSRateLimiter:
+    """limiter of sts calls made by unattended refreshes"""
+    return STSRateLimiter(rate=config["sts_rate"], burst=config["sts_burst"])
 
 
-@click.command()
+def export_metrics():
+    """
+    write prometheus textfile metrics when textfile directory is set.
+    metrics never break a refresh, the session is already written then
+    """
+    if config["textfile_dir"] is None:
+        return
+    try:
+        exporter = TextfileExporter(config["textfile_dir"])
+        exporter.export(SessionCache.cached_config_names() or [config["config_name"]])
+    except (OSError, sqlite3.Error) as err:
+        logger.warning("failed export metrics to {}: {}", config["textfile_dir"], err)
+
+
+@click.group(invoke_without_command=True)
 @click.option(
     "--token-code",
-    prompt="MFA token code",
     help="check token code from your own authenticator",
 )
-def main(token_code: str) -> None:
+@click.option(
+    "--token-provider",
+    help="where token codes come from when --token-code is not given: "
+    "prompt (default), stdin, totp:<seed-file> or command:<command>. "
+    "overrides AWS_MFA_TOKEN_PROVIDER",
+)
+@click.option("--mfa-arn", help="arn of your mfa device, overrides AWS_MFA_ARN")
+@click.option(
+    "--config-name",
+    help="credentials profile to write session to, overrides CONFIG_NAME",
+)
+@click.option(
+    "--textfile-dir",
+    envvar="AWS_MFA_AUTH_TEXTFILE_DIR",
+    type=click.Path(file_okay=False),
+    help="write prometheus textfile collector metrics to this directory",
+)
+@click.option(
+    "--sts-rate",
+    envvar="AWS_MFA_AUTH_STS_RATE",
+    default=STSRateLimiter.DEFAULT_RATE,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="sts calls per second per account of unattended refreshes",
+)
+@click.option(
+    "--sts-burst",
+    envvar="AWS_MFA_AUTH_STS_BURST",
+    default=STSRateLimiter.DEFAULT_BURST,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="sts calls per account allowed at once before --sts-rate applies",
+)
+@click.option(
+    "--log-level",
+    envvar="AWS_MFA_AUTH_LOG_LEVEL",
+    default="DEBUG",
+    show_default=True,
+    type=click.Choice(["TRACE", "DEBUG", "INFO", "WARNING", "ERROR"]),
+    help="records below this level are neither formatted nor scrubbed",
+)
+@click.pass_context
+def main(
+    ctx: click.Context,
+    token_code: str,
+    token_provider: str,
+    mfa_arn: str,
+    config_name: str,
+    textfile_dir: str,
+    sts_rate: float,
+    sts_burst: float,
+    log_level: str,
+) -> None:
+    """refresh mfa session when no command is given"""
     global config
 
-    if not isinstance(token_code, str):
-        token_code = str(token_code)
-    config["aws_token_code"] = token_code
+    setup_logging(log_level)
+    read_settings(
+        {
+            "aws_mfa_arn": mfa_arn,
+            "config_name": config_name,
+            "token_provider": token_provider,
+        }
+    )
+    config["textfile_dir"] = textfile_dir
+    config["sts_rate"] = sts_rate
+    config["sts_burst"] = sts_burst
+
+    if ctx.invoked_subcommand is not None:
+        return
+
+    require_settings()
+
+    try:
+        if token_code is None:
+            provider = get_token_provider(config["token_provider"])
+            token_code = ReplayGuard(config["aws_mfa_arn"]).unused_code(provider)
+        if not isinstance(token_code, str):
+            token_code = str(token_code)
+        config["aws_token_code"] = token_code
+
+        # concurrent invocations on this host wait for a single refresh and reuse it
+        try:
+            refresh_single_flight(config["config_name"], refresh_session)
+        finally:
+            # single flight saved session cache by now, so expiry is current
+            export_metrics()
+    except TokenProviderError as err:
+        raise click.ClickException(str(err))
+
+
+@main.command()
+@click.option("--days", default=30, show_default=True, help="report last N days")
+def stats(days: int) -> None:
+    """report refresh latency, failure rate and frequency per profile"""
+    since = time.time() - days * 86400
+    profile_stats = TelemetryStore().stats(since=since)
+    if not profile_stats:
+        click.echo(f"no refresh recorded in last {days} days.")
+        return
 
-    config_response = get_session_configuration()
-    edit_config_file(config_response)
+    def format_seconds(value):
+        return "-" if value is None else f"{value:.3f}s"
+
+    click.echo(
+        f"{'profile':<24}{'refreshes':>10}{'per day':>9}{'failed':>8}"
+        f"{'p50':>9}{'p95':>9}{'p99':>9}"
+    )
+    for row in profile_stats:
+        click.echo(
+            f"{row['profile']:<24}{row['refreshes']:>10}"
+            f"{row['refreshes_per_day']:>9.2f}{row['failure_rate']:>8.1%}"
+            f"{format_seconds(row['p50']):>9}{format_seconds(row['p95']):>9}"
+            f"{format_seconds(row['p99']):>9}"
+        )
+
+
+@main.command()
+@click.option(
+    "--interval",
+    default=RefreshDaemon.DEFAULT_INTERVAL,
+    show_default=True,
+    help="seconds between iterations",
+)
+@click.option(
+    "--shared-memory",
+    is_flag=True,
+    help="publish cached sessions to shared memory for fast local reads",
+)
+@click.option(
+    "--auto-refresh",
+    is_flag=True,
+    help="refresh sessions before they expire, for profiles with an "
+    "unattended token provider such as totp:<seed-file>",
+)
+def daemon(interval: int, shared_memory: bool, auto_refresh: bool) -> None:
+    """keep session health metrics exported on a timer"""
+    exporter = None
+    if config["textfile_dir"] is not None:
+        exporter = TextfileExporter(config["textfile_dir"])
+    RefreshDaemon(
+        interval=interval,
+        exporter=exporter,
+        shared_memory=shared_memory,
+        auto_refresh=auto_refresh,
+        rate_limiter=get_rate_limiter(),
+    ).run()
+
+
+@main.command("refresh-all")
+def refresh_all() -> None:
+    """
+    refresh every profile which expires within 15 mins and has an unattended
+    token provider, within --sts-rate and --sts-burst
+    """
+    profiles = sorted(
+        set(SessionCache.cached_config_names()) | set(SettingsLoader().get_profiles())
+    )
+    refreshable = get_refreshable_profiles(profiles, RefreshDaemon.REFRESH_MARGIN)
+    if not refreshable:
+        click.echo("no profile to refresh.")
+        return
+    results = refresh_profiles(
+        refreshable,
+        rate_limiter=get_rate_limiter(),
+        margin=RefreshDaemon.REFRESH_MARGIN,
+    )
+    export_metrics()
+    if any(isinstance(result, Exception) for result in results):
+        raise click.ClickException("some profiles failed to refresh, see log")
+
+
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    default=str(DEFAULT_SOCKET_PATH),
+    show_default=True,
+    type=click.Path(dir_okay=False),
+    help="unix socket to listen on",
+)
+@click.option(
+    "--auto-refresh",
+    is_flag=True,
+    help="refresh expiring sessions of profiles with an unattended token provider",
+)
+def broker(socket_path: str, auto_refresh: bool) -> None:
+    """serve cached sessions of all profiles over a unix socket"""
+    try:
+        credential_broker = CredentialBroker(
+            auto_refresh=auto_refresh, rate_limiter=get_rate_limiter()
+        )
+        server = BrokerServer(socket_path, credential_broker)
+    except BrokerError as err:
+        raise click.ClickException(str(err))
+    # service managers stop daemons with SIGTERM, remove socket then
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    logger.info("broker listening on {}", socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@main.command("credential-process")
+@click.option(
+    "--socket",
+    "socket_path",
+    default=str(DEFAULT_SOCKET_PATH),
+    show_default=True,
+    type=click.Path(dir_okay=False),
+    help="unix socket of broker",
+)
+def credential_process(socket_path: str) -> None:
+    """print session of config name in aws `credential_process` format"""
+    if not config["config_name"]:
+        raise click.UsageError(f"missing {SETTINGS['config_name']}")
+    try:
+        with BrokerClient(socket_path) as client:
+            click.echo(client.get_json(config["config_name"]))
+    except (BrokerError, OSError) as err:
+        raise click.ClickException(f"broker on {socket_path} failed: {err}")
 
 
 if __name__ == "__main__":
-    read_local_env()
     main()
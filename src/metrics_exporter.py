@@ -0,0 +1,107 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from clock import CLOCK_SKEW, corrected_now
+from log import logger
+from session_cache import SessionCache
+from telemetry import TelemetryStore
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class TextfileExporter:
+    """write session health metrics for prometheus node_exporter textfile collector"""
+
+    textfile_path: Path
+
+    FILE_NAME = "aws_mfa_auth.prom"
+
+    def __init__(
+        self, textfile_dir: Path, telemetry_store: Optional[TelemetryStore] = None
+    ) -> None:
+        self.textfile_path = Path(textfile_dir) / self.FILE_NAME
+        self.telemetry_store = telemetry_store or TelemetryStore()
+
+    def collect(self, profiles: Iterable[str]) -> str:
+        """render metrics of profiles in prometheus text format"""
+        now = corrected_now()
+        expiry_lines: List[str] = []
+        duration_lines: List[str] = []
+        write_lines: List[str] = []
+        error_lines: List[str] = []
+
+        for profile in profiles:
+            label = f'profile="{escape_label(profile)}"'
+
+            credentials = SessionCache(profile).load()
+            if credentials is not None:
+                expires_in = credentials.expiration - now
+                expiry_lines.append(
+                    f"aws_mfa_session_expiry_seconds{{{label}}} "
+                    f"{expires_in.total_seconds():.0f}"
+                )
+
+            last_refresh = self.telemetry_store.last_refresh(profile)
+            if last_refresh is None:
+                continue
+            if last_refresh["duration"] is not None:
+                duration_lines.append(
+                    f"aws_mfa_last_refresh_duration_seconds{{{label}}} "
+                    f"{last_refresh['duration']:.6f}"
+                )
+            if last_refresh["credentials_write"] is not None:
+                write_lines.append(
+                    f"aws_mfa_credentials_write_seconds{{{label}}} "
+                    f"{last_refresh['credentials_write']:.6f}"
+                )
+
+        for row in self.telemetry_store.error_counts():
+            error_lines.append(
+                f'aws_mfa_sts_errors_total{{profile="{escape_label(row["profile"])}",'
+                f'error_code="{escape_label(row["error_code"] or "")}"}} {row["count"]}'
+            )
+
+        metrics = [
+            "# HELP aws_mfa_session_expiry_seconds Seconds until mfa session expires.",
+            "# TYPE aws_mfa_session_expiry_seconds gauge",
+            *expiry_lines,
+            "# HELP aws_mfa_last_refresh_duration_seconds Duration of last refresh.",
+            "# TYPE aws_mfa_last_refresh_duration_seconds gauge",
+            *duration_lines,
+            "# HELP aws_mfa_credentials_write_seconds Last credentials file write latency.",
+            "# TYPE aws_mfa_credentials_write_seconds gauge",
+            *write_lines,
+            "# HELP aws_mfa_sts_errors_total Failed refreshes by sts error code.",
+            "# TYPE aws_mfa_sts_errors_total counter",
+            *error_lines,
+            "# HELP aws_mfa_clock_skew_seconds Estimated seconds local clock is behind aws.",
+            "# TYPE aws_mfa_clock_skew_seconds gauge",
+            f"aws_mfa_clock_skew_seconds {CLOCK_SKEW.skew:.3f}",
+        ]
+        return "\n".join(metrics) + "\n"
+
+    def export(self, profiles: Iterable[str]) -> None:
+        """
+        write metrics file.
+        file is replaced atomically so node_exporter never reads a partial file
+        """
+        contents = self.collect(profiles)
+        self.textfile_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.textfile_path.parent, prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as metrics_file:
+                metrics_file.write(contents)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, self.textfile_path)
+        except Exception as err:
+            logger.error("failed write metrics to {}", self.textfile_path)
+            os.unlink(temp_path)
+            raise err
+        else:
+            logger.debug("succeed write metrics to {}", self.textfile_path)
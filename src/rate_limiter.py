@@ -0,0 +1,195 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from log import logger
+
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+}
+
+# (account id, region name)
+LimiterKey = Tuple[str, str]
+
+
+def is_throttling_error(err: Exception) -> bool:
+    if not isinstance(err, ClientError):
+        return False
+    return err.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+class TokenBucket:
+    """thread safe token bucket refilled with `rate` tokens per second"""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """block until `tokens` are available and return waited seconds"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency limit.
+
+    limit grows by one on every success and is halved on throttling.
+    use instance as context manager to hold one slot while calling sts.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def __enter__(self) -> "AdaptiveConcurrency":
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    def on_success(self) -> None:
+        with self.condition:
+            # additive increase, about +1 per `limit` successful calls
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.condition.notify()
+
+    def on_throttle(self) -> None:
+        with self.condition:
+            self.limit = max(self.minimum, self.limit / 2)
+            logger.warning("sts throttled, decrease concurrency to {}", int(self.limit))
+
+
+class STSRateLimiter:
+    """
+    rate limiter for sts calls.
+
+    keeps one token bucket and one adaptive concurrency limit
+    per account and region, because sts throttles per account.
+    """
+
+    # sts GetSessionToken quota is shared by every caller of the account,
+    # stay well below it by default
+    DEFAULT_RATE = 10.0
+    DEFAULT_BURST = 10.0
+    MAX_ATTEMPTS = 4
+    # throttled calls are retried after exponential backoff with full jitter
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 8.0
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: float = DEFAULT_BURST,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 32,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.buckets: Dict[LimiterKey, TokenBucket] = {}
+        self.concurrency: Dict[LimiterKey, AdaptiveConcurrency] = {}
+        self.succeeded: Dict[LimiterKey, int] = {}
+        self.throttled: Dict[LimiterKey, int] = {}
+        self.started_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def _get_limits(self, key: LimiterKey) -> Tuple[TokenBucket, AdaptiveConcurrency]:
+        with self.lock:
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+            if key not in self.buckets:
+                self.buckets[key] = TokenBucket(self.rate, self.burst)
+                self.concurrency[key] = AdaptiveConcurrency(
+                    initial=self.initial_concurrency, maximum=self.max_concurrency
+                )
+                self.succeeded[key] = 0
+                self.throttled[key] = 0
+            return self.buckets[key], self.concurrency[key]
+
+    def call(self, key: LimiterKey, func: Callable, *args, **kwargs):
+        """call `func` within rate and concurrency limits of `key`"""
+        bucket, concurrency = self._get_limits(key)
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            bucket.acquire()
+            throttled = False
+            with concurrency:
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as err:
+                    if not is_throttling_error(err) or attempt == self.MAX_ATTEMPTS:
+                        raise err
+                    concurrency.on_throttle()
+                    with self.lock:
+                        self.throttled[key] += 1
+                    throttled = True
+
+            if throttled:
+                # back off outside of concurrency slot, other callers keep going
+                delay = self.get_backoff(attempt)
+                logger.debug("sts throttled, retry in {:.2f}s", delay)
+                time.sleep(delay)
+                continue
+
+            concurrency.on_success()
+            with self.lock:
+                self.succeeded[key] += 1
+            return result
+
+    def get_backoff(self, attempt: int) -> float:
+        """seconds to wait before retrying a call throttled `attempt` times"""
+        ceiling = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def throughput(self) -> Dict[LimiterKey, float]:
+        """achieved successful calls per second for each account and region"""
+        with self.lock:
+            if self.started_at is None:
+                return {}
+            elapsed = max(time.monotonic() - self.started_at, 1e-9)
+            return {key: count / elapsed for key, count in self.succeeded.items()}
+
+    def log_report(self) -> None:
+        for (account, region), calls_per_second in self.throughput().items():
+            key = (account, region)
+            logger.info(
+                "sts {}/{}: {} calls, {} throttled, {:.2f} calls/sec",
+                account,
+                region,
+                self.succeeded[key],
+                self.throttled[key],
+                calls_per_second,
+            )
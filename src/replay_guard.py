@@ -0,0 +1,100 @@
+import fcntl
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from constants import MFA_AUTH_HOME
+from log import logger
+from token_provider import TokenProvider, TokenProviderError
+
+
+class TokenCodeReusedError(TokenProviderError):
+    """token code was already sent to sts for this mfa device"""
+
+
+class ReplayGuard:
+    """
+    per mfa device record of recently used token codes.
+
+    sts rejects a code which was already used for the same device, a reused
+    code fails here before any network call. records are kept for a few
+    code windows, afterwards sts rejects the code as expired anyway.
+    """
+
+    GUARD_DIR = MFA_AUTH_HOME / "used-codes"
+    # 3 windows of 30s, sts accepts codes of adjacent windows too
+    RETENTION = 90
+
+    record_path: Path
+
+    def __init__(self, mfa_arn: str, guard_dir: Optional[Path] = None) -> None:
+        self.mfa_arn = mfa_arn
+        device = re.sub(r"[^A-Za-z0-9_.-]", "_", mfa_arn)
+        self.record_path = Path(guard_dir or self.GUARD_DIR) / f"{device}.json"
+
+    def update(self, change: Callable[[Dict[str, float], float], Any]) -> Any:
+        """
+        apply `change` to used codes under an exclusive lock of the record file,
+        so racing processes never both claim a code. returns result of `change`
+        """
+        self.record_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.record_path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+") as record_file:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                used_codes: Dict[str, float] = json.loads(record_file.read() or "{}")
+            except ValueError:
+                used_codes = {}
+
+            now = time.time()
+            used_codes = {
+                code: used_at
+                for code, used_at in used_codes.items()
+                if now - used_at < self.RETENTION
+            }
+            result = change(used_codes, now)
+
+            record_file.seek(0)
+            record_file.truncate()
+            json.dump(used_codes, record_file)
+        return result
+
+    def is_used(self, code: str) -> bool:
+        return self.update(lambda used_codes, now: code in used_codes)
+
+    def claim(self, code: str) -> None:
+        """record code as used, raise when it was used within retention"""
+
+        def claim_code(used_codes: Dict[str, float], now: float) -> bool:
+            if code in used_codes:
+                return False
+            used_codes[code] = now
+            return True
+
+        if not self.update(claim_code):
+            raise TokenCodeReusedError(
+                f"token code was already used for {self.mfa_arn}, "
+                "wait for the next code"
+            )
+
+    def release(self, code: str) -> None:
+        """forget a claimed code which sts never accepted, it may be retried"""
+        self.update(lambda used_codes, now: used_codes.pop(code, None))
+
+    def unused_code(self, provider: TokenProvider) -> str:
+        """
+        code of provider which was not used yet. providers of time based codes
+        wait for the next window, others hand out the code and fail on claim
+        """
+        code = provider()
+        while self.is_used(code):
+            remaining = provider.remaining_seconds()
+            if remaining is None:
+                break
+            logger.info("token code was already used, wait {:.0f}s for next", remaining)
+            time.sleep(remaining)
+            code = provider()
+        return code
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from clock import corrected_now
+from constants import MFA_AUTH_HOME
+from credentials import SessionCredentials
+from log import logger
+
+
+class SessionCache:
+    """local cache of mfa session credentials, one json file per config name"""
+
+    cache_path: Path
+
+    CACHE_DIR = MFA_AUTH_HOME / "cache"
+
+    def __init__(self, config_name: str, cache_dir: Optional[Path] = None) -> None:
+        self.config_name = config_name
+        self.cache_path = Path(cache_dir or self.CACHE_DIR) / f"{config_name}.json"
+
+    @classmethod
+    def cached_config_names(cls, cache_dir: Optional[Path] = None) -> List[str]:
+        """config names which have a cached session"""
+        cache_dir = Path(cache_dir or cls.CACHE_DIR)
+        if not cache_dir.exists():
+            return []
+        return sorted(path.stem for path in cache_dir.glob("*.json"))
+
+    def load(self) -> Optional[SessionCredentials]:
+        """read cached session credentials. return None when there is no cache yet"""
+        try:
+            with open(self.cache_path) as cache_file:
+                return SessionCredentials.from_dict(json.load(cache_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as err:
+            logger.warning(
+                "ignore unreadable session cache {}: {}", self.cache_path, err
+            )
+            return None
+
+    def modified_at(self) -> Optional[int]:
+        """last modification time of cache file in ns, None when not cached"""
+        try:
+            return self.cache_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def save(self, credentials: SessionCredentials) -> None:
+        """
+        write session credentials to cache file.
+        file is replaced atomically so readers never see a half written cache
+        """
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(credentials.to_dict(), cache_file)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.cache_path)
+        except Exception as err:
+            logger.error("failed write session cache to {}", self.cache_path)
+            os.unlink(temp_path)
+            raise err
+        else:
+            logger.debug("succeed write session cache to {}", self.cache_path)
+
+    @staticmethod
+    def is_fresh(credentials: Optional[SessionCredentials], margin: int = 0) -> bool:
+        """
+        check cached session is not expired within `margin` seconds,
+        judged by aws clock so local clock drift does not matter
+        """
+        if credentials is None:
+            return False
+
+        now = corrected_now()
+        return credentials.expiration - now > timedelta(seconds=margin)
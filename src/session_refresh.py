@@ -0,0 +1,37 @@
+from typing import Callable
+
+from aws_client import AWSClient
+from config_editor import ConfigEditor
+from credentials import SessionCredentials
+from replay_guard import TokenCodeReusedError
+from telemetry import RefreshRecord, TelemetryStore
+
+
+def refresh_and_record(
+    profile: str, create_client: Callable[[], AWSClient]
+) -> SessionCredentials:
+    """
+    request new session with client of `create_client`, write it to
+    credentials file of profile and record the refresh to telemetry
+    """
+    refresh_record = RefreshRecord(profile)
+    try:
+        aws_client = create_client()
+        refresh_record.endpoint = aws_client.endpoint_url
+        refresh_record.timings = aws_client.timings
+        credentials = aws_client.request_session_token()
+        refresh_record.expiration = credentials.expiration.isoformat()
+        config_editor = ConfigEditor(profile, credentials)
+        config_editor.edit()
+        refresh_record.timings["credentials_write"] = config_editor.write_duration
+    except TokenCodeReusedError as err:
+        # rejected locally before any sts call, not a refresh attempt
+        refresh_record.discard()
+        raise err
+    except Exception as err:
+        refresh_record.fail(err)
+        raise err
+    finally:
+        refresh_record.finish()
+        TelemetryStore().record(refresh_record)
+    return credentials
@@ -0,0 +1,186 @@
+import configparser
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from dotenv import dotenv_values, find_dotenv
+
+from log import logger
+
+# setting name -> variable name in environment, `.env` and user config
+SETTINGS = {
+    "aws_mfa_arn": "AWS_MFA_ARN",
+    "config_name": "CONFIG_NAME",
+    "token_provider": "AWS_MFA_TOKEN_PROVIDER",
+}
+
+# settings a refresh can not do without
+REQUIRED_SETTINGS = ("aws_mfa_arn", "config_name")
+
+APP_NAME = "aws-mfa-auth"
+
+
+def get_user_config_dir() -> Path:
+    """`$XDG_CONFIG_HOME/aws-mfa-auth`, `~/.config/aws-mfa-auth` by default"""
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config_home) / APP_NAME
+
+
+class ParsedFileCache:
+    """
+    thread safe cache of parsed files keyed by path, validated by mtime, size
+    and inode. files replaced atomically get a new inode, so a rewrite within
+    one mtime tick is noticed even when size does not change.
+
+    a cached file costs one stat per lookup, it is parsed again only
+    after it changed on disk
+    """
+
+    entries: Dict[Tuple[Path, Callable], Tuple[Tuple[int, int, int], Any]]
+
+    def __init__(self) -> None:
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.parse_count = 0
+
+    def get(self, path: Path, parse: Callable[[Path], Any], default: Any = None) -> Any:
+        """parsed contents of `path`, `default` when it does not exist"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return default
+
+        key = (path, parse)
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self.lock:
+            cached = self.entries.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        parsed = parse(path)
+        with self.lock:
+            self.parse_count += 1
+            self.entries[key] = (version, parsed)
+        return parsed
+
+
+FILE_CACHE = ParsedFileCache()
+
+
+def parse_env_file(path: Path) -> Dict[str, str]:
+    """setting values of a dotenv file"""
+    values = dotenv_values(path)
+    return {
+        name: values[env_name]
+        for name, env_name in SETTINGS.items()
+        if values.get(env_name)
+    }
+
+
+def parse_profiles_file(path: Path) -> Dict[str, Dict[str, str]]:
+    """profile name -> setting values of an ini file with section per profile"""
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return {
+        section: {
+            name: parser[section][name]
+            for name in SETTINGS
+            if parser[section].get(name)
+        }
+        for section in parser.sections()
+    }
+
+
+class SettingsLoader:
+    """
+    merge settings from layers, first one wins:
+
+    1. cli flags
+    2. environment variables
+    3. project `.env`, searched from working directory upwards
+    4. user config `~/.config/aws-mfa-auth/config.env`
+    5. profiles manifest `~/.config/aws-mfa-auth/profiles.ini`,
+       a section per config name
+
+    files are parsed once and reused until they change.
+    """
+
+    def __init__(
+        self,
+        environ: Optional[Mapping[str, str]] = None,
+        user_config_dir: Optional[Path] = None,
+        file_cache: ParsedFileCache = FILE_CACHE,
+    ) -> None:
+        self.environ = os.environ if environ is None else environ
+        self.user_config_dir = Path(user_config_dir or get_user_config_dir())
+        self.file_cache = file_cache
+
+    @property
+    def user_config_path(self) -> Path:
+        return self.user_config_dir / "config.env"
+
+    @property
+    def profiles_path(self) -> Path:
+        return self.user_config_dir / "profiles.ini"
+
+    def find_project_env(self) -> Optional[Path]:
+        path = find_dotenv(usecwd=True)
+        return Path(path) if path else None
+
+    def get_layers(
+        self, cli_values: Mapping[str, Optional[str]]
+    ) -> List[Dict[str, str]]:
+        """setting values of every layer above profiles manifest, by precedence"""
+        layers = [
+            {name: value for name, value in cli_values.items() if value},
+            {
+                name: self.environ[env_name]
+                for name, env_name in SETTINGS.items()
+                if self.environ.get(env_name)
+            },
+        ]
+        project_env = self.find_project_env()
+        if project_env is not None:
+            layers.append(self.file_cache.get(project_env, parse_env_file, {}))
+        layers.append(self.file_cache.get(self.user_config_path, parse_env_file, {}))
+        return layers
+
+    def get_profiles(self) -> Dict[str, Dict[str, str]]:
+        return self.file_cache.get(self.profiles_path, parse_profiles_file, {})
+
+    def load(
+        self, cli_values: Optional[Mapping[str, Optional[str]]] = None
+    ) -> Dict[str, Optional[str]]:
+        """merged settings, unresolved ones are None"""
+        settings: Dict[str, Optional[str]] = dict.fromkeys(SETTINGS)
+        for layer in reversed(self.get_layers(cli_values or {})):
+            settings.update(layer)
+
+        profiles = self.get_profiles()
+        if settings["config_name"] is None and len(profiles) == 1:
+            # single profile manifest does not need a config name anywhere else
+            settings["config_name"] = next(iter(profiles))
+        profile = profiles.get(settings["config_name"], {})
+        for name, value in profile.items():
+            if settings[name] is None:
+                settings[name] = value
+
+        logger.trace("loaded settings of [{}]", settings["config_name"])
+        return settings
+
+    def load_profile(self, config_name: str) -> Dict[str, Optional[str]]:
+        """
+        settings of a named profile, e.g. for refreshing many profiles in bulk.
+
+        environment and `.env` layers usually describe the single profile of an
+        interactive setup, values of the profile section in `profiles.ini` win
+        over them here. a token provider of those layers is dropped when the
+        section names another device, its codes would not fit
+        """
+        settings = self.load({"config_name": config_name})
+        profile = self.get_profiles().get(config_name, {})
+        if profile.get("aws_mfa_arn") not in (None, settings["aws_mfa_arn"]):
+            settings["token_provider"] = None
+        settings.update(profile)
+        return settings
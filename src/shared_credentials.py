@@ -0,0 +1,133 @@
+import _posixshmem
+import json
+import mmap
+import os
+import re
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple, Union
+
+from credentials import SessionCredentials
+from log import logger
+
+
+def get_segment_name(config_name: str) -> str:
+    """shared memory names are global, scope them by user and config name"""
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", config_name)
+    return f"aws-mfa-auth-{os.getuid()}-{safe_name}"
+
+
+def map_segment(name: str) -> mmap.mmap:
+    """
+    map existing segment read only.
+    attaching with `SharedMemory` would start a resource tracker process in
+    every reader, which also unlinks the segment when the reader exits
+    """
+    fd = _posixshmem.shm_open(f"/{name}", os.O_RDONLY, mode=0)
+    try:
+        return mmap.mmap(fd, os.fstat(fd).st_size, prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
+
+
+class SharedCredentials:
+    """
+    session credentials of one config name in a shared memory segment.
+
+    the refresh daemon publishes, any process on the host reads with plain
+    memory reads once attached. writes are guarded by a seqlock: sequence is
+    odd while a write is in progress, readers retry until they copied the
+    payload between two equal even sequence reads.
+
+    layout: sequence (u64) | payload length (u32) | json payload
+    """
+
+    HEADER = struct.Struct("<QI")
+    SEQUENCE = struct.Struct("<Q")
+    SIZE = 8192
+    MAX_READ_ATTEMPTS = 1000
+
+    mapping: Union[SharedMemory, mmap.mmap]
+    buffer: memoryview
+
+    def __init__(
+        self, config_name: str, mapping: Union[SharedMemory, mmap.mmap]
+    ) -> None:
+        """`mapping` is the owned segment of publisher or read only map of reader"""
+        self.config_name = config_name
+        self.mapping = mapping
+        if isinstance(mapping, SharedMemory):
+            self.buffer = mapping.buf
+        else:
+            self.buffer = memoryview(mapping)
+        # last read snapshot, reused while sequence does not change
+        self.snapshot: Tuple[int, Optional[SessionCredentials]] = (0, None)
+
+    @classmethod
+    def create(cls, config_name: str) -> "SharedCredentials":
+        """create segment for publishing, reuse one left by a previous daemon"""
+        name = get_segment_name(config_name)
+        try:
+            segment = SharedMemory(name=name, create=True, size=cls.SIZE)
+        except FileExistsError:
+            # owner tracks the segment, it is unlinked even if daemon is killed
+            segment = SharedMemory(name=name)
+        return cls(config_name, segment)
+
+    @classmethod
+    def attach(cls, config_name: str) -> Optional["SharedCredentials"]:
+        """attach segment for reading, None when no daemon publishes it"""
+        try:
+            mapping = map_segment(get_segment_name(config_name))
+        except FileNotFoundError:
+            return None
+        return cls(config_name, mapping)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.buffer) - self.HEADER.size
+
+    def publish(self, credentials: SessionCredentials) -> None:
+        payload = json.dumps(credentials.to_dict()).encode()
+        if len(payload) > self.capacity:
+            raise ValueError(
+                f"credentials of [{self.config_name}] do not fit shared memory "
+                f"({len(payload)} > {self.capacity} bytes)"
+            )
+
+        buffer = self.buffer
+        (sequence,) = self.SEQUENCE.unpack_from(buffer, 0)
+        # odd while writing, skip past odd sequence of an interrupted write
+        sequence += 1 + sequence % 2
+        self.HEADER.pack_into(buffer, 0, sequence, len(payload))
+        buffer[self.HEADER.size : self.HEADER.size + len(payload)] = payload
+        self.SEQUENCE.pack_into(buffer, 0, sequence + 1)
+        logger.debug("published [{}] to shared memory", self.config_name)
+
+    def read(self) -> Optional[SessionCredentials]:
+        """consistent snapshot of credentials, None when nothing is published yet"""
+        buffer = self.buffer
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            sequence, length = self.HEADER.unpack_from(buffer, 0)
+            if sequence == self.snapshot[0]:
+                return self.snapshot[1]
+            if sequence % 2 or length > self.capacity:
+                continue
+            payload = bytes(buffer[self.HEADER.size : self.HEADER.size + length])
+            if self.SEQUENCE.unpack_from(buffer, 0)[0] != sequence:
+                continue
+
+            credentials = SessionCredentials.from_dict(json.loads(payload))
+            self.snapshot = (sequence, credentials)
+            return credentials
+
+        logger.warning("shared memory of [{}] is busy, give up", self.config_name)
+        return None
+
+    def close(self) -> None:
+        self.buffer.release()
+        self.mapping.close()
+
+    def unlink(self) -> None:
+        """remove segment of publisher, attached readers keep their mapping"""
+        self.mapping.unlink()
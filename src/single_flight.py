@@ -0,0 +1,69 @@
+import fcntl
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+from constants import MFA_AUTH_HOME
+from credentials import SessionCredentials
+from log import logger
+from session_cache import SessionCache
+
+
+class RefreshLock:
+    """cross process exclusive lock around session refresh of one config name"""
+
+    lock_path: Path
+
+    LOCK_DIR = MFA_AUTH_HOME / "locks"
+
+    def __init__(self, config_name: str, lock_dir: Optional[Path] = None) -> None:
+        self.config_name = config_name
+        self.lock_path = Path(lock_dir or self.LOCK_DIR) / f"{config_name}.lock"
+        self.lock_fd: Optional[int] = None
+
+    def __enter__(self) -> "RefreshLock":
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info(
+                "another process is refreshing [{}], wait for it.", self.config_name
+            )
+            fcntl.flock(self.lock_fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+        os.close(self.lock_fd)
+        self.lock_fd = None
+
+
+def refresh_single_flight(
+    config_name: str,
+    refresh: Callable[[], SessionCredentials],
+    margin: Optional[int] = None,
+) -> SessionCredentials:
+    """
+    run `refresh` in exactly one process per host at a time.
+
+    processes which waited for another refresh reuse its result from the
+    session cache instead of calling sts again. with `margin`, any cached session
+    which is not expired within `margin` seconds is reused as well.
+    """
+    session_cache = SessionCache(config_name)
+    cache_mtime = session_cache.modified_at()
+
+    with RefreshLock(config_name):
+        cached = session_cache.load()
+        updated_by_other = session_cache.modified_at() != cache_mtime
+        if updated_by_other and SessionCache.is_fresh(cached):
+            logger.info("reuse session refreshed by another process [{}]", config_name)
+            return cached
+        if margin is not None and SessionCache.is_fresh(cached, margin=margin):
+            logger.debug("reuse cached session [{}]", config_name)
+            return cached
+
+        credentials = refresh()
+        session_cache.save(credentials)
+        return credentials
@@ -0,0 +1,189 @@
+import math
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from constants import MFA_AUTH_HOME
+from log import logger
+
+SUCCESS = "success"
+FAILURE = "failure"
+
+PHASES = ("client_init", "sts_call", "parse", "credentials_write")
+
+
+def get_error_code(err: Exception) -> str:
+    """sts error code for client errors, exception name for others"""
+    if isinstance(err, ClientError):
+        return err.response.get("Error", {}).get("Code", "Unknown")
+    return type(err).__name__
+
+
+def percentile(sorted_values: List[float], rank: float) -> Optional[float]:
+    """nearest rank percentile of already sorted values"""
+    if not sorted_values:
+        return None
+    index = math.ceil(rank / 100 * len(sorted_values)) - 1
+    return sorted_values[min(max(index, 0), len(sorted_values) - 1)]
+
+
+class RefreshRecord:
+    """timings and outcome of one session refresh"""
+
+    timings: Dict[str, float]
+
+    def __init__(self, profile: str) -> None:
+        self.profile = profile
+        self.started_at = time.time()
+        self.started_counter = time.perf_counter()
+        self.endpoint: Optional[str] = None
+        self.outcome = SUCCESS
+        self.error_code: Optional[str] = None
+        self.expiration: Optional[str] = None
+        self.duration: Optional[float] = None
+        self.timings = {}
+        # refresh which never reached sts is not stored
+        self.discarded = False
+
+    def discard(self) -> None:
+        self.discarded = True
+
+    def fail(self, err: Exception) -> None:
+        self.outcome = FAILURE
+        self.error_code = get_error_code(err)
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self.started_counter
+
+
+class TelemetryStore:
+    """local sqlite store of refresh records"""
+
+    db_path: Path
+
+    DB_PATH = MFA_AUTH_HOME / "telemetry.sqlite3"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS refresh (
+        id INTEGER PRIMARY KEY,
+        started_at REAL NOT NULL,
+        profile TEXT NOT NULL,
+        endpoint TEXT,
+        outcome TEXT NOT NULL,
+        error_code TEXT,
+        expiration TEXT,
+        duration REAL,
+        client_init REAL,
+        sts_call REAL,
+        parse REAL,
+        credentials_write REAL
+    );
+    CREATE INDEX IF NOT EXISTS refresh_profile_started_at
+        ON refresh (profile, started_at);
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self.db_path = Path(db_path or self.DB_PATH)
+
+    def connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        connection.row_factory = sqlite3.Row
+        connection.executescript(self.SCHEMA)
+        return connection
+
+    def record(self, refresh_record: RefreshRecord) -> None:
+        """store refresh record. telemetry never breaks a refresh"""
+        if refresh_record.discarded:
+            return
+        try:
+            with closing(self.connect()) as connection, connection:
+                connection.execute(
+                    """
+                    INSERT INTO refresh (
+                        started_at, profile, endpoint, outcome, error_code,
+                        expiration, duration, client_init, sts_call, parse,
+                        credentials_write
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        refresh_record.started_at,
+                        refresh_record.profile,
+                        refresh_record.endpoint,
+                        refresh_record.outcome,
+                        refresh_record.error_code,
+                        refresh_record.expiration,
+                        refresh_record.duration,
+                        *[refresh_record.timings.get(phase) for phase in PHASES],
+                    ),
+                )
+        except (OSError, sqlite3.Error) as err:
+            logger.warning(
+                "failed record refresh telemetry to {}: {}", self.db_path, err
+            )
+
+    def last_refresh(self, profile: str) -> Optional[sqlite3.Row]:
+        """most recent refresh record of profile"""
+        with closing(self.connect()) as connection:
+            return connection.execute(
+                """
+                SELECT * FROM refresh WHERE profile = ?
+                ORDER BY started_at DESC LIMIT 1
+                """,
+                (profile,),
+            ).fetchone()
+
+    def error_counts(self) -> List[sqlite3.Row]:
+        """failed refresh count per profile and error code"""
+        with closing(self.connect()) as connection:
+            return connection.execute(
+                """
+                SELECT profile, error_code, COUNT(*) AS count
+                FROM refresh WHERE outcome = ?
+                GROUP BY profile, error_code
+                """,
+                (FAILURE,),
+            ).fetchall()
+
+    def stats(self, since: Optional[float] = None) -> List[dict]:
+        """latency percentiles, failure rate and refresh frequency per profile"""
+        since = since or 0.0
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                """
+                SELECT profile, started_at, outcome, duration
+                FROM refresh WHERE started_at >= ?
+                ORDER BY profile, started_at
+                """,
+                (since,),
+            ).fetchall()
+
+        by_profile: Dict[str, List[sqlite3.Row]] = {}
+        for row in rows:
+            by_profile.setdefault(row["profile"], []).append(row)
+
+        profile_stats = []
+        for profile, profile_rows in by_profile.items():
+            durations = sorted(
+                row["duration"] for row in profile_rows if row["duration"] is not None
+            )
+            failures = sum(row["outcome"] == FAILURE for row in profile_rows)
+            first_at = profile_rows[0]["started_at"]
+            last_at = profile_rows[-1]["started_at"]
+            days = max((last_at - first_at) / 86400, 1.0)
+            profile_stats.append(
+                {
+                    "profile": profile,
+                    "refreshes": len(profile_rows),
+                    "failure_rate": failures / len(profile_rows),
+                    "refreshes_per_day": len(profile_rows) / days,
+                    "p50": percentile(durations, 50),
+                    "p95": percentile(durations, 95),
+                    "p99": percentile(durations, 99),
+                }
+            )
+        return profile_stats
@@ -0,0 +1,178 @@
+import base64
+import hashlib
+import hmac
+import shlex
+import stat
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+import click
+
+from log import logger
+
+
+class TokenProviderError(Exception):
+    """token code could not be obtained"""
+
+
+class TokenProvider:
+    """
+    source of mfa token codes.
+    providers are callable, so they fit every `token_code_provider` argument
+    """
+
+    # waits for a person, can not be used by daemon or broker
+    interactive = False
+
+    def get_code(self) -> str:
+        raise NotImplementedError
+
+    def remaining_seconds(self) -> Optional[float]:
+        """seconds until current code rolls over, None when unknown"""
+        return None
+
+    def __call__(self) -> str:
+        return self.get_code()
+
+
+class PromptTokenProvider(TokenProvider):
+    """ask on terminal"""
+
+    interactive = True
+
+    def get_code(self) -> str:
+        return str(click.prompt("MFA token code"))
+
+
+class StdinTokenProvider(TokenProvider):
+    """read one line of stdin per code, for scripts piping codes in"""
+
+    interactive = True
+
+    def get_code(self) -> str:
+        line = sys.stdin.readline()
+        if not line:
+            raise TokenProviderError("stdin is closed, no token code to read")
+        return line.strip()
+
+
+class CommandTokenProvider(TokenProvider):
+    """run a command which prints a code, e.g. password manager cli"""
+
+    TIMEOUT = 30
+
+    def __init__(self, command: str) -> None:
+        self.command = command
+
+    def get_code(self) -> str:
+        try:
+            completed = subprocess.run(
+                shlex.split(self.command),
+                capture_output=True,
+                check=True,
+                text=True,
+                timeout=self.TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError) as err:
+            raise TokenProviderError(f"token command failed: {err}")
+        return completed.stdout.strip()
+
+
+class TOTPTokenProvider(TokenProvider):
+    """
+    RFC 6238 time based codes of a virtual mfa device.
+
+    seed file holds base32 secret shown when the device was assigned,
+    or the `otpauth://` uri of its qr code. it must be readable by owner only.
+    """
+
+    DIGEST = {"sha1": hashlib.sha1, "sha256": hashlib.sha256, "sha512": hashlib.sha512}
+
+    def __init__(
+        self,
+        seed_path: Path,
+        min_remaining: float = 5,
+        digits: int = 6,
+        period: int = 30,
+        algorithm: str = "sha1",
+    ) -> None:
+        """
+        a code which rolls over within `min_remaining` seconds is not handed out,
+        provider waits for the next window instead
+        """
+        self.seed_path = Path(seed_path).expanduser()
+        self.min_remaining = min_remaining
+        self.digits = digits
+        self.period = period
+        self.algorithm = algorithm
+
+    def read_secret(self) -> bytes:
+        try:
+            seed_stat = self.seed_path.stat()
+            seed = self.seed_path.read_text().strip()
+        except OSError as err:
+            raise TokenProviderError(f"can not read seed file {self.seed_path}: {err}")
+        if seed_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+            raise TokenProviderError(
+                f"seed file {self.seed_path} is accessible by others, chmod 600 it"
+            )
+
+        try:
+            if seed.startswith("otpauth://"):
+                query = parse_qs(urlparse(seed).query)
+                if "secret" not in query:
+                    raise ValueError("otpauth uri has no secret")
+                seed = unquote(query["secret"][0])
+                self.digits = int(query.get("digits", [self.digits])[0])
+                self.period = int(query.get("period", [self.period])[0])
+                self.algorithm = query.get("algorithm", [self.algorithm])[0].lower()
+            if self.algorithm not in self.DIGEST:
+                raise ValueError(f"unsupported algorithm {self.algorithm!r}")
+
+            seed = seed.replace(" ", "").upper()
+            return base64.b32decode(seed + "=" * (-len(seed) % 8))
+        except ValueError as err:
+            # binascii.Error of malformed base32 is a ValueError
+            raise TokenProviderError(f"invalid seed in {self.seed_path}: {err}")
+
+    def generate(self, secret: bytes, for_time: float) -> str:
+        counter = int(for_time // self.period)
+        digest = hmac.new(
+            secret, counter.to_bytes(8, "big"), self.DIGEST[self.algorithm]
+        ).digest()
+        offset = digest[-1] & 0x0F
+        code = int.from_bytes(digest[offset : offset + 4], "big") & 0x7FFFFFFF
+        return str(code % 10**self.digits).zfill(self.digits)
+
+    def remaining_seconds(self, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return self.period - now % self.period
+
+    def get_code(self) -> str:
+        secret = self.read_secret()
+        remaining = self.remaining_seconds()
+        if remaining < self.min_remaining:
+            logger.debug("token code rolls over in {:.1f}s, wait for next", remaining)
+            time.sleep(remaining)
+        return self.generate(secret, time.time())
+
+
+def get_token_provider(spec: Optional[str]) -> TokenProvider:
+    """
+    build provider from its spec:
+    `prompt` (default), `stdin`, `totp:<seed-file>` or `command:<command>`
+    """
+    kind, _, argument = (spec or "prompt").partition(":")
+    if kind == "prompt":
+        return PromptTokenProvider()
+    if kind == "stdin":
+        return StdinTokenProvider()
+    if kind == "totp" and argument:
+        return TOTPTokenProvider(Path(argument))
+    if kind == "command" and argument:
+        return CommandTokenProvider(argument)
+    raise TokenProviderError(f"unknown token provider {spec!r}")
@@ -0,0 +1,63 @@
+from typing import Optional
+
+from aws_client import AWSClient
+from client_cache import ClientCache
+from credentials import SessionCredentials
+from log import logger
+from rate_limiter import STSRateLimiter
+from replay_guard import ReplayGuard
+from session_refresh import refresh_and_record
+from settings import SettingsLoader
+from single_flight import refresh_single_flight
+from token_provider import TokenProvider, TokenProviderError, get_token_provider
+
+
+def get_unattended_provider(spec: Optional[str]) -> Optional[TokenProvider]:
+    """provider of spec when it needs nobody at the terminal, None otherwise"""
+    if not spec:
+        return None
+    provider = get_token_provider(spec)
+    if provider.interactive:
+        return None
+    return provider
+
+
+def can_refresh_unattended(profile: str) -> bool:
+    settings = SettingsLoader().load_profile(profile)
+    try:
+        return get_unattended_provider(settings["token_provider"]) is not None
+    except TokenProviderError:
+        return False
+
+
+def refresh_unattended(
+    profile: str,
+    margin: Optional[int] = None,
+    client_cache: Optional[ClientCache] = None,
+    rate_limiter: Optional[STSRateLimiter] = None,
+) -> SessionCredentials:
+    """
+    refresh session of profile with token provider of its settings and
+    write it to credentials file, like an interactive refresh does
+    """
+    settings = SettingsLoader().load_profile(profile)
+    provider = get_unattended_provider(settings["token_provider"])
+    if provider is None or not settings["aws_mfa_arn"]:
+        raise TokenProviderError(f"[{profile}] can not be refreshed unattended")
+
+    def refresh() -> SessionCredentials:
+        logger.info("refresh mfa session for [{}] unattended", profile)
+        replay_guard = ReplayGuard(settings["aws_mfa_arn"])
+
+        def create_client() -> AWSClient:
+            return AWSClient(
+                mfa_arn=settings["aws_mfa_arn"],
+                token_code=replay_guard.unused_code(provider),
+                rate_limiter=rate_limiter,
+                client_cache=client_cache,
+                replay_guard=replay_guard,
+            )
+
+        return refresh_and_record(profile, create_client)
+
+    return refresh_single_flight(profile, refresh, margin=margin)